@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Firebase CLI helpers shared by the desktop and web wizards
+
+The CLI itself is run through a run_firebase(firebase_account, *args, **kwargs)
+callable supplied by each wizard, so each keeps its own subprocess environment.
+"""
+
+import random
+import re
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Optional
+
+# Firebase CLI resolved on PATH once; on Windows this also finds firebase.cmd
+FIREBASE_BIN = shutil.which('firebase') or 'firebase'
+
+# Firebase platforms, in the order they are reported to the user
+FIREBASE_PLATFORMS = ('ios', 'android', 'web')
+PLATFORM_LABELS = {'ios': 'iOS', 'android': 'Android', 'web': 'Web'}
+FIREBASE_APP_CREATE_TIMEOUTS = {'ios': 90, 'android': 60, 'web': 60}
+
+# Patterns tried in order when pulling an app ID out of `firebase apps:create` output
+APP_ID_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'App ID: ([0-9]+:[0-9]+:[a-z]+:[a-zA-Z0-9]+)',
+    r'App ID: ([a-zA-Z0-9-]+)',
+    r'([0-9]+:[0-9]+:[a-z]+:[a-zA-Z0-9]+)',
+    r'([a-zA-Z0-9-]{20,})',
+    r'Created app ([a-zA-Z0-9-]+)',
+    r'App created: ([a-zA-Z0-9-]+)',
+    r'App ID ([a-zA-Z0-9-]+)',
+    r'([a-zA-Z0-9-]{15,})'
+)]
+APP_ID_WORD_RE = re.compile(r'^[a-zA-Z0-9-:]+$')
+
+# Where each platform's SDK config is written inside the project
+FIREBASE_CONFIG_PATHS = {
+    'ios': Path('ios') / 'Runner' / 'GoogleService-Info.plist',
+    'android': Path('android') / 'app' / 'google-services.json',
+    'web': Path('web') / 'firebase-config.js',
+}
+
+
+def retry_delay(attempt: int) -> float:
+    """Seconds to wait after a failed attempt: doubling from 1s up to 4s, plus up to 0.5s of jitter"""
+    return min(2 ** (attempt - 1), 4) + random.random() * 0.5
+
+
+def extract_app_id(output: str) -> str:
+    """Extract app ID from Firebase CLI output"""
+    print(f"Extracting app ID from output: {output}")
+
+    for i, pattern in enumerate(APP_ID_PATTERNS):
+        match = pattern.search(output)
+        if match and match.group(1):
+            app_id = match.group(1)
+            print(f"Found app ID with pattern {i}: {app_id}")
+            return app_id
+
+    # Try to extract any long alphanumeric string that looks like an app ID
+    words = output.split()
+    for word in words:
+        if len(word) > 15 and APP_ID_WORD_RE.match(word):
+            print(f"Found potential app ID in word: {word}")
+            return word
+
+    print("No app ID found in output")
+    return 'unknown'
+
+
+def create_firebase_app(run_firebase, platform: str, project_id: str, project_name: str, bundle_id: str,
+                        firebase_account: str):
+    """Create a single Firebase app and return (platform, app_id)"""
+    label = PLATFORM_LABELS[platform]
+    timeout = FIREBASE_APP_CREATE_TIMEOUTS[platform]
+    args = ['apps:create', platform, f'{project_name}-{platform}']
+    if platform == 'ios':
+        args += ['--bundle-id', bundle_id]
+    elif platform == 'android':
+        args += ['--package-name', bundle_id]
+    args += ['--project', project_id]
+
+    try:
+        print(f"Creating {label} app: {project_name}-{platform}")
+        # Empty input answers the interactive iOS prompt
+        result = run_firebase(firebase_account, *args, check=True, capture_output=True, text=True,
+                              timeout=timeout, input='\n' if platform == 'ios' else None)
+        print(f"{label} app creation output: {result.stdout}")
+        app_id = extract_app_id(result.stdout)
+        print(f"{label} app ID: {app_id}")
+        return platform, app_id
+    except subprocess.TimeoutExpired:
+        print(f'{label} app creation timed out after {timeout} seconds')
+    except subprocess.CalledProcessError as e:
+        print(f'Failed to create {label} app: {e}')
+        print(f'Error output: {e.stderr}')
+    except Exception as e:
+        print(f'Unexpected error creating {label} app: {e}')
+
+    print(f'Continuing without {label} app...')
+    return platform, 'unknown'
+
+
+def download_firebase_config(run_firebase, project_dir: Path, platform: str, app_id: str, project_id: str,
+                             firebase_account: str):
+    """Download a single Firebase SDK config into the project and return (platform, content)"""
+    label = PLATFORM_LABELS[platform]
+    try:
+        print(f"Downloading {label} config for app ID: {app_id}")
+        result = run_firebase(
+            firebase_account,
+            'apps:sdkconfig', platform, app_id, '--project', project_id,
+            check=True, capture_output=True, text=True, timeout=30)
+
+        config_path = project_dir / FIREBASE_CONFIG_PATHS[platform]
+        config_path.parent.mkdir(parents=True, exist_ok=True)
+        config_path.write_text(result.stdout, encoding='utf-8')
+        print(f"✅ {label} config downloaded successfully")
+        return platform, result.stdout
+    except subprocess.CalledProcessError as e:
+        print(f'Failed to download {label} config: {e}')
+    except subprocess.TimeoutExpired:
+        print(f'{label} config download timed out')
+    return platform, None
+
+
+def create_firebase_apps(run_firebase, project_id: str, project_name: str, org_domain: str, firebase_account: str,
+                         project_dir: Optional[Path] = None, platforms=FIREBASE_PLATFORMS,
+                         on_app_created=None) -> Dict[str, str]:
+    """Create Firebase apps for the given platforms (iOS, Android, and Web by default), mapping
+    each to its app ID or 'unknown'. on_app_created(platform, app_id) is called as each finishes;
+    with project_dir, each app's SDK config is downloaded as soon as that app exists"""
+    bundle_id = f'com.{org_domain}.{project_name}'
+    results = {platform: 'unknown' for platform in platforms}
+
+    print(f"Creating Firebase apps for project: {project_id}")
+    print(f"Bundle ID: {bundle_id}")
+    print(f"Firebase account: {firebase_account}")
+
+    def create_and_download(platform):
+        platform, app_id = create_firebase_app(run_firebase, platform, project_id, project_name, bundle_id, firebase_account)
+        if project_dir is not None and app_id != 'unknown':
+            download_firebase_config(run_firebase, project_dir, platform, app_id, project_id, firebase_account)
+        return platform, app_id
+
+    # The apps:create calls are independent, so run them concurrently; a quick
+    # platform's config download then overlaps the slower iOS creation
+    with ThreadPoolExecutor(max_workers=len(platforms)) as executor:
+        futures = [executor.submit(create_and_download, platform) for platform in platforms]
+        for future in as_completed(futures):
+            platform, app_id = future.result()
+            results[platform] = app_id
+            if on_app_created:
+                on_app_created(platform, app_id)
+
+    successful_apps = sum(1 for app_id in results.values() if app_id != 'unknown')
+    print(f"Successfully created {successful_apps} out of {len(platforms)} apps")
+    print(f"App results: {results}")
+    return results
+
+
+def download_firebase_configs(run_firebase, project_dir: Path, project_id: str, app_ids: Dict[str, str],
+                              firebase_account: str) -> Dict[str, str]:
+    """Download the SDK config of every app with a known ID; returns platform -> content"""
+    configs = {}
+
+    print(f"Downloading Firebase configs for project: {project_id}")
+    print(f"App IDs: {app_ids}")
+
+    platforms = []
+    for platform in FIREBASE_PLATFORMS:
+        if app_ids[platform] and app_ids[platform] != 'unknown':
+            platforms.append(platform)
+        else:
+            print(f"⏭️ Skipping {PLATFORM_LABELS[platform]} config download (no valid app ID)")
+
+    if platforms:
+        # Each apps:sdkconfig call is independent, so download them concurrently
+        with ThreadPoolExecutor(max_workers=len(platforms)) as executor:
+            futures = [
+                executor.submit(download_firebase_config, run_firebase, project_dir, platform, app_ids[platform],
+                                project_id, firebase_account)
+                for platform in platforms
+            ]
+            for future in as_completed(futures):
+                platform, content = future.result()
+                if content is not None:
+                    configs[platform] = content
+
+    print(f"Downloaded configs: {list(configs.keys())}")
+    return configs
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Git helpers shared by the desktop and web wizards
+"""
+
+from pathlib import Path
+
+# Optional in-process git support
+try:
+    import pygit2
+    PYGIT2_AVAILABLE = True
+except ImportError:
+    PYGIT2_AVAILABLE = False
+
+
+def git_commit_all(repo_dir: Path, message: str):
+    """Stage every file and commit it in-process with pygit2; None if nothing changed"""
+    repo = pygit2.Repository(str(repo_dir))
+    repo.index.add_all()
+    repo.index.write()
+    tree = repo.index.write_tree()
+    if not repo.head_is_unborn and tree == repo.head.peel(pygit2.Commit).tree_id:
+        return None
+    signature = repo.default_signature
+    parents = [] if repo.head_is_unborn else [repo.head.target]
+    return repo.create_commit('HEAD', signature, signature, message, tree, parents)
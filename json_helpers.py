@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+JSON helpers shared by the desktop and web wizards
+"""
+
+import json
+from pathlib import Path
+
+# Optional fast JSON support
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def json_loads(data):
+    """Parse JSON from str or bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_bytes(obj) -> bytes:
+    """Serialise an API response body to compact UTF-8 JSON, via json for data orjson rejects"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+def json_dumps(obj) -> str:
+    """Serialise to 2-space indented JSON with non-ASCII written as UTF-8 rather than \\u escapes;
+    orjson may format floats differently, and data it rejects (e.g. non-str keys) goes through json"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def write_json(path: Path, obj):
+    """Write obj as 2-space indented UTF-8 JSON; orjson's bytes go straight to disk"""
+    if ORJSON_AVAILABLE:
+        try:
+            path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+            return
+        except TypeError:
+            pass
+    path.write_text(json.dumps(obj, indent=2, ensure_ascii=False), encoding='utf-8')
@@ -6,15 +6,26 @@ A desktop application for creating new projects with Firebase and GitHub integra
 
 import sys
 import os
+import copy
+import errno
+import hashlib
+import importlib.util
 import json
+import plistlib
+import secrets
+import shutil
+import stat
 import subprocess
+import tempfile
 import threading
 import webbrowser
 import re
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
 
 # GUI imports
 try:
@@ -23,23 +34,227 @@ try:
                                 QTextEdit, QComboBox, QCheckBox, QProgressBar,
                                 QTabWidget, QGroupBox, QMessageBox, QFileDialog)
     from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
-    from PyQt6.QtGui import QFont, QIcon
+    from PyQt6.QtGui import QFont, QIcon, QTextCursor
     PYQT_AVAILABLE = True
 except ImportError:
     PYQT_AVAILABLE = False
 
-# Web interface imports
+# Web interface: Flask is only imported when FlaskWizard is started
+FLASK_AVAILABLE = all(importlib.util.find_spec(name) is not None for name in ('flask', 'webview'))
+
 try:
-    from flask import Flask, render_template, request, jsonify
-    from webview import create_window, start
     import requests
-    FLASK_AVAILABLE = True
 except ImportError:
-    FLASK_AVAILABLE = False
-    try:
-        import requests
-    except ImportError:
-        requests = None
+    requests = None
+
+# Optional in-process git support
+try:
+    import pygit2
+    PYGIT2_AVAILABLE = True
+except ImportError:
+    PYGIT2_AVAILABLE = False
+
+from firebase_helpers import (
+    FIREBASE_BIN, FIREBASE_CONFIG_PATHS, PLATFORM_LABELS,
+    create_firebase_apps, download_firebase_configs, retry_delay
+)
+from git_helpers import git_commit_all
+from json_helpers import json_dumps, json_loads
+
+# Parsed config.json contents keyed by path, tagged with the file's mtime
+_CONFIG_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+# GitHub token validation results as token -> (checked_at, is_valid)
+_TOKEN_VALIDATION_CACHE: Dict[str, Tuple[float, bool]] = {}
+TOKEN_VALIDATION_TTL = 300  # seconds
+
+# Template access checks as (repo, branch, token hash) -> (checked_at, error or None)
+_PREFLIGHT_CACHE: Dict[Tuple[str, str, str], Tuple[float, Optional[str]]] = {}
+PREFLIGHT_TTL = 60  # seconds
+
+PROJECT_NAME_RE = re.compile(r'^[a-z0-9-]+$')
+
+# GitHub list endpoints are read 100 items per page, remaining pages in parallel
+GITHUB_PER_PAGE = 100
+GITHUB_PAGE_WORKERS = 8
+
+# GitHub listings as (url, token hash) -> (fetched_at, [(etag, items) per page])
+_GITHUB_LIST_CACHE: Dict[Tuple[str, str], Tuple[float, List[Tuple[Optional[str], List[Dict[str, Any]]]]]] = {}
+GITHUB_LIST_TTL = 300  # seconds
+
+# Finished web jobs whose result was never collected are dropped this long after submission
+JOB_RESULT_TTL = 3600  # seconds
+
+# GoogleService-Info.plist keys copied into app_config.json
+PLIST_CONFIG_KEYS = {
+    'API_KEY': 'apiKey',
+    'GCM_SENDER_ID': 'messagingSenderId',
+    'GOOGLE_APP_ID': 'appId',
+}
+
+# firebase-config.js values copied into app_config.json; the regex is only a
+# fallback for snippets whose object literal is not valid JSON
+WEB_CONFIG_KEYS = ('apiKey', 'authDomain', 'projectId', 'storageBucket', 'messagingSenderId', 'appId', 'measurementId')
+WEB_CONFIG_RE = re.compile(rf'"(?P<key>{"|".join(WEB_CONFIG_KEYS)})":\s*"(?P<value>[^"]+)"')
+
+# Template identifiers rewritten for each new project; the bundle ID must come
+# first so it wins over the bare app name it contains. Matched on raw bytes, so
+# template files are rewritten whatever their encoding or the locale's
+TEMPLATE_IDENTIFIER_RE = re.compile(rb'com\.meghzone\.mytemplate-app|mytemplate-app')
+
+# Environment passed to git and Firebase CLI subprocesses: only the variables
+# they need (including the Windows essentials and proxy settings), built once
+SUBPROCESS_ENV_KEYS = {
+    'PATH', 'PATHEXT', 'HOME', 'USER', 'LOGNAME', 'LANG', 'LC_ALL', 'TMPDIR', 'TEMP', 'TMP',
+    'XDG_CONFIG_HOME', 'SSH_AUTH_SOCK', 'SYSTEMROOT', 'COMSPEC', 'USERPROFILE', 'HOMEDRIVE', 'HOMEPATH',
+    'APPDATA', 'LOCALAPPDATA', 'PROGRAMDATA', 'HTTP_PROXY', 'HTTPS_PROXY', 'NO_PROXY', 'http_proxy',
+    'https_proxy', 'no_proxy', 'SSL_CERT_FILE', 'SSL_CERT_DIR', 'NODE_EXTRA_CA_CERTS'
+}
+SUBPROCESS_ENV_PREFIXES = ('GIT_', 'FIREBASE_', 'GOOGLE_')
+SUBPROCESS_ENV = {
+    key: value for key, value in os.environ.items()
+    if key in SUBPROCESS_ENV_KEYS or key.startswith(SUBPROCESS_ENV_PREFIXES)
+}
+
+# Environment for Firebase CLI calls; skips the npm update check that
+# firebase-tools otherwise performs on every launch
+FIREBASE_CLI_ENV = dict(SUBPROCESS_ENV, NO_UPDATE_NOTIFIER='1')
+
+# Environment for git calls; a bad token fails fast instead of waiting on a prompt
+GIT_ENV = dict(SUBPROCESS_ENV, GIT_TERMINAL_PROMPT='0')
+
+# git resolved on PATH once
+GIT_BIN = shutil.which('git') or 'git'
+
+# Finished projects; work-in-progress lives in hidden temp dirs inside it so the
+# final move is always a same-filesystem rename
+PROJECTS_DIR = Path('projects')
+
+# Local bare mirrors of template branches, refreshed before each clone
+TEMPLATE_CACHE_DIR = Path.home() / '.newprojwiz' / 'templates'
+# One lock per cache dir, held only while that mirror is initialised and fetched
+_TEMPLATE_CACHE_LOCKS: Dict[Path, threading.Lock] = {}
+_TEMPLATE_CACHE_LOCKS_GUARD = threading.Lock()
+
+# Caps concurrent template clones when several projects are created at once
+MAX_CONCURRENT_CLONES = 4
+_CLONE_SEMAPHORE = threading.BoundedSemaphore(MAX_CONCURRENT_CLONES)
+
+# The template's app configuration, updated with the Firebase app settings
+APP_CONFIG_JSON_PATH = Path('assets') / 'config' / 'app_config.json'
+
+# Static Firebase files written into every new project
+FIREBASE_JSON = json.dumps({
+    "firestore": {
+        "rules": "firestore.rules",
+        "indexes": "firestore.indexes.json"
+    },
+    "storage": {
+        "rules": "storage.rules"
+    },
+    "emulators": {
+        "auth": {"port": 9099},
+        "firestore": {"port": 8080},
+        "storage": {"port": 9199},
+        "ui": {"enabled": True}
+    }
+}, indent=2)
+FIRESTORE_INDEXES_JSON = json.dumps({"indexes": [], "fieldOverrides": []}, indent=2)
+
+# lib/firebase_config.dart, filled in with format_map(project_name=..., org_domain=...)
+FLUTTER_FIREBASE_CONFIG_TEMPLATE = '''import 'package:firebase_core/firebase_core.dart';
+import 'package:cloud_firestore/cloud_firestore.dart';
+import 'package:firebase_storage/firebase_storage.dart';
+
+class FirebaseConfig {{
+  static const String projectId = '{project_name}';
+  static const String storageBucket = '{project_name}.appspot.com';
+  static const String orgDomain = '{org_domain}';
+  
+  static Future<void> initializeFirebase() async {{
+    await Firebase.initializeApp(
+      options: const FirebaseOptions(
+        apiKey: 'YOUR_API_KEY', // Will be replaced with actual config
+        appId: 'YOUR_APP_ID', // Will be replaced with actual config
+        messagingSenderId: 'YOUR_SENDER_ID', // Will be replaced with actual config
+        projectId: projectId,
+        storageBucket: storageBucket,
+      ),
+    );
+  }}
+  
+  static FirebaseFirestore get firestore => FirebaseFirestore.instance;
+  static FirebaseStorage get storage => FirebaseStorage.instance;
+  
+  // Storage root path for the project
+  static String get storageRoot => 'projects/{project_name}';
+}}'''
+
+# lib/app_config.ts is APP_CONFIG_TS_PRELUDE, the app_config.json contents, then APP_CONFIG_TS_EPILOGUE
+APP_CONFIG_TS_PRELUDE = '''// Auto-generated Firebase app configuration types
+export interface FirebaseAppConfig {
+  app?: {
+    name?: string;
+    description?: string;
+    version?: string;
+    buildNumber?: string;
+  };
+  firebase?: {
+    web?: {
+      apiKey?: string;
+      appId?: string;
+      messagingSenderId?: string;
+      projectId?: string;
+      authDomain?: string;
+      storageBucket?: string;
+      measurementId?: string;
+    };
+    android?: {
+      apiKey?: string;
+      appId?: string;
+      messagingSenderId?: string;
+      projectId?: string;
+      storageBucket?: string;
+    };
+    ios?: {
+      apiKey?: string;
+      appId?: string;
+      messagingSenderId?: string;
+      projectId?: string;
+      storageBucket?: string;
+      iosBundleId?: string;
+    };
+  };
+  assets?: any;
+  features?: any;
+  api?: any;
+  ui?: any;
+  localization?: any;
+}
+
+// Import the configuration from assets/config/app_config.json
+export const appConfig: FirebaseAppConfig = '''
+APP_CONFIG_TS_EPILOGUE = ';\n'
+
+def _clear_readonly_and_retry(func, path, _):
+    """rmtree error handler: git marks object files read-only, which blocks deletion on Windows"""
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
+def _rmtree(path):
+    """Remove a directory tree in one scandir-based pass, including read-only files"""
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=_clear_readonly_and_retry)
+    else:
+        shutil.rmtree(path, onerror=_clear_readonly_and_retry)
+
+def _write_if_changed(path: Path, new: str) -> bool:
+    """Write text to a file only if its content differs; return True if written"""
+    old = path.read_text(encoding='utf-8') if path.exists() else None
+    if old == new:
+        return False
+    path.write_text(new, encoding='utf-8')
+    return True
 
 class ProjectWizard:
     """Main project wizard class"""
@@ -47,14 +262,32 @@ class ProjectWizard:
     def __init__(self):
         self.config = self.load_config()
         self.current_project = {}
+        # Raw file contents as path -> (mtime_ns, size, data), see _read_cached
+        self._file_cache: Dict[str, Tuple[int, int, bytes]] = {}
+        self.session = requests.Session() if requests else None
+        if self.session:
+            # Enough pooled connections for the parallel GitHub page fetches
+            self.session.mount('https://', requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16))
+            # Sent with every GitHub call; requests already asks for gzip/deflate bodies
+            self.session.headers.update({
+                'Accept': 'application/vnd.github.v3+json',
+                'User-Agent': 'Project-Wizard'
+            })
         
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from file"""
         config_path = Path("config.json")
         if config_path.exists():
             try:
-                with open(config_path, 'r') as f:
-                    return json.load(f)
+                # Reuse the parsed config until the file changes on disk
+                mtime_ns = config_path.stat().st_mtime_ns
+                cached = _CONFIG_CACHE.get(str(config_path))
+                if cached and cached[0] == mtime_ns:
+                    return copy.deepcopy(cached[1])
+                
+                config = json_loads(config_path.read_bytes())
+                _CONFIG_CACHE[str(config_path)] = (mtime_ns, config)
+                return copy.deepcopy(config)
             except Exception as e:
                 print(f"Error loading config: {e}")
         
@@ -72,9 +305,11 @@ class ProjectWizard:
     
     def save_config(self):
         """Save configuration to file"""
+        config_path = Path("config.json")
         try:
-            with open("config.json", 'w') as f:
-                json.dump(self.config, f, indent=2)
+            config_path.write_text(json_dumps(self.config), encoding='utf-8')
+            # Keep the cache in step with what was just written
+            _CONFIG_CACHE[str(config_path)] = (config_path.stat().st_mtime_ns, copy.deepcopy(self.config))
         except Exception as e:
             print(f"Error saving config: {e}")
     
@@ -91,74 +326,102 @@ class ProjectWizard:
             init_git = project_data.get('init_git', True)
             setup_firebase = project_data.get('setup_firebase', False)
             
-            # Validate required fields
-            if not project_name or not org_domain or not template_repo or not template_branch:
-                return {"success": False, "error": "Missing required fields: name, org_domain, template_repo, template_branch"}
-            
-            # Validate project name format
-            if not re.match(r'^[a-z0-9-]+$', project_name):
-                return {"success": False, "error": "Project name must contain only lowercase letters, numbers, and hyphens"}
-            
-            # Create temporary directory
-            import tempfile
-            temp_dir = Path(tempfile.mkdtemp(prefix=f'{project_name}-'))
+            # Validate everything that can fail before cloning anything
+            error = self._preflight(project_name, org_domain, template_repo, template_branch)
+            if error:
+                return {"success": False, "error": error}
             
-            try:
+            # Work in a temporary directory that is always removed on exit; the
+            # project lives in a subdirectory so it can be moved out on success
+            PROJECTS_DIR.mkdir(exist_ok=True)
+            with tempfile.TemporaryDirectory(prefix=f'.{project_name}-', dir=PROJECTS_DIR) as workspace:
+                temp_dir = Path(workspace) / project_name
+                
                 # Step 1: Clone template repository
                 github_url = self._clone_template_repository(temp_dir, template_repo, template_branch)
                 
-                # Step 2: Rename project identifiers
-                self._rename_project_identifiers(temp_dir, project_name, org_domain)
-                
-                # Step 3: Create Firebase configuration files
-                self._create_firebase_config_files(temp_dir, project_name, org_domain)
-                
-                # Step 4: Create Firebase project (if requested)
-                firebase_project_id = None
-                app_ids = None
-                if setup_firebase and firebase_account:
-                    firebase_project_id = self._create_firebase_project(project_name, firebase_account)
-                    app_ids = self._create_firebase_apps(firebase_project_id, project_name, org_domain, firebase_account)
-                    self._setup_firestore_database(firebase_project_id, project_name, firebase_account)
-                    self._download_firebase_configs(temp_dir, firebase_project_id, app_ids, firebase_account)
-                    self._update_app_config_json(temp_dir, firebase_project_id, project_name, org_domain, app_ids)
-                
-                # Step 5: Commit changes
-                self._commit_and_push_changes(temp_dir, project_name)
-                
-                # Step 6: Create new private repository
-                new_repo_url = self._create_private_repository(temp_dir, project_name)
-                
-                # Step 7: Create base build tag
-                self._create_base_build_tag(temp_dir, project_name)
+                # Steps after the clone that only wait on GitHub or Firebase run on
+                # this pool alongside the local file work
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    # The empty GitHub repository does not depend on the project contents
+                    private_repo = executor.submit(self._create_github_repository, project_name)
+                    
+                    try:
+                        # Step 2: Rename project identifiers
+                        self._rename_project_identifiers(temp_dir, project_name, org_domain)
+                        
+                        # Step 3: Create Firebase configuration files
+                        self._create_firebase_config_files(temp_dir, project_name, org_domain)
+                        
+                        # Step 4: Create Firebase project (if requested)
+                        firebase_project_id = None
+                        app_ids = None
+                        if setup_firebase and firebase_account:
+                            firebase_project_id = self._create_firebase_project(project_name, firebase_account)
+                            # Firestore setup only needs the project, so it runs alongside the app steps
+                            firestore_setup = executor.submit(self._setup_firestore_database, temp_dir, firebase_project_id, project_name, firebase_account)
+                            app_ids = self._create_firebase_apps(firebase_project_id, project_name, org_domain, firebase_account, temp_dir=temp_dir)
+                            self._update_app_config_json(temp_dir, firebase_project_id, project_name, org_domain, app_ids)
+                            firestore_setup.result()
+                        
+                        # Step 5: Commit changes
+                        self._commit_and_push_changes(temp_dir, project_name)
+                        
+                        # Step 6: Create base build tag
+                        base_build_tag = self._create_base_build_tag(temp_dir, project_name)
+                        
+                        # Step 7: Push main with the tag to the new private repository
+                        new_repo_url = self._push_to_private_repository(temp_dir, private_repo.result())
+                    except Exception:
+                        # Don't leave an empty repository behind to block a retry with the same name
+                        self._delete_github_repository(private_repo)
+                        raise
                 
                 # Step 8: Move to final location
-                final_project_dir = Path('projects') / project_name
-                if final_project_dir.exists():
-                    import shutil
-                    shutil.rmtree(final_project_dir)
-                temp_dir.rename(final_project_dir)
-                
-                return {
-                    'success': True,
-                    'project_path': str(final_project_dir),
-                    'firebase_project_id': firebase_project_id,
-                    'github_url': github_url,
-                    'new_repo_url': new_repo_url,
-                    'base_build_tag': f'base-build-{datetime.now().strftime("%Y-%m-%d")}',
-                    'message': f'Project {project_name} created successfully!'
-                }
-                
-            except Exception as e:
-                # Clean up temp directory on error
-                if temp_dir.exists():
-                    import shutil
-                    shutil.rmtree(temp_dir)
-                raise e
+                final_project_dir = PROJECTS_DIR / project_name
+                self._move_project(temp_dir, final_project_dir)
+            
+            return {
+                'success': True,
+                'project_path': str(final_project_dir),
+                'firebase_project_id': firebase_project_id,
+                'github_url': github_url,
+                'new_repo_url': new_repo_url,
+                'base_build_tag': base_build_tag,
+                'message': f'Project {project_name} created successfully!'
+            }
             
         except Exception as e:
             return {"success": False, "error": str(e)}
     
+    def create_projects(self, projects, max_concurrency: int = 4):
+        """Create several independent projects concurrently; results keep the input order"""
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            return list(executor.map(self.create_project, projects))
+    
+    def _move_project(self, src: Path, dest: Path):
+        """Move a finished project into place, replacing any previous copy"""
+        dest.parent.mkdir(exist_ok=True)
+        try:
+            os.replace(src, dest)
+            return
+        except FileNotFoundError:
+            raise Exception(f"Temporary directory {src} was deleted unexpectedly")
+        except OSError as e:
+            if e.errno != errno.EXDEV and not dest.exists():
+                raise
+            cross_device = e.errno == errno.EXDEV
+        
+        # Only reached when a previous copy of the project is in the way or src is
+        # on another filesystem (e.g. /tmp on tmpfs)
+        if dest.exists():
+            _rmtree(dest)
+        if cross_device:
+            # Copy file data and permissions only, skipping the timestamp/xattr copy of copy2
+            shutil.move(str(src), str(dest), copy_function=shutil.copy)
+        else:
+            os.replace(src, dest)
+    
     def update_project_config(self, project_dir: Path, project_data: Dict[str, Any]):
         """Update project configuration files"""
         project_name = project_data['name']
@@ -167,26 +430,22 @@ class ProjectWizard:
         # Update package.json (if exists)
         package_json = project_dir / "package.json"
         if package_json.exists():
-            with open(package_json, 'r') as f:
-                package_data = json.load(f)
+            package_data = json_loads(package_json.read_bytes())
             
             package_data['name'] = project_name.lower().replace(' ', '-')
             package_data['description'] = project_data.get('description', f'{project_name} project')
             
-            with open(package_json, 'w') as f:
-                json.dump(package_data, f, indent=2)
+            _write_if_changed(package_json, json_dumps(package_data))
         
         # Update app.json (React Native)
         app_json = project_dir / "app.json"
         if app_json.exists():
-            with open(app_json, 'r') as f:
-                app_data = json.load(f)
+            app_data = json_loads(app_json.read_bytes())
             
             app_data['expo']['name'] = project_name
             app_data['expo']['slug'] = project_name.lower().replace(' ', '-')
             
-            with open(app_json, 'w') as f:
-                json.dump(app_data, f, indent=2)
+            _write_if_changed(app_json, json_dumps(app_data))
     
     def init_git_repository(self, project_dir: Path, project_name: str):
         """Initialize git repository"""
@@ -194,13 +453,16 @@ class ProjectWizard:
             # Remove existing git
             git_dir = project_dir / ".git"
             if git_dir.exists():
-                import shutil
-                shutil.rmtree(git_dir)
+                _rmtree(git_dir)
             
             # Initialize new git repository
-            subprocess.run(['git', 'init'], cwd=project_dir, check=True)
-            subprocess.run(['git', 'add', '.'], cwd=project_dir, check=True)
-            subprocess.run(['git', 'commit', '-m', f'Initial commit for {project_name}'], cwd=project_dir, check=True)
+            if PYGIT2_AVAILABLE:
+                pygit2.init_repository(str(project_dir))
+                git_commit_all(project_dir, f'Initial commit for {project_name}')
+            else:
+                subprocess.run([GIT_BIN, 'init'], cwd=project_dir, check=True, env=GIT_ENV)
+                subprocess.run([GIT_BIN, 'add', '.'], cwd=project_dir, check=True, env=GIT_ENV)
+                subprocess.run([GIT_BIN, 'commit', '-m', f'Initial commit for {project_name}'], cwd=project_dir, check=True, env=GIT_ENV)
             
         except Exception as e:
             print(f"Error initializing git: {e}")
@@ -217,8 +479,7 @@ class ProjectWizard:
             }
             
             firebase_file = project_dir / "firebase-config.json"
-            with open(firebase_file, 'w') as f:
-                json.dump(firebase_config, f, indent=2)
+            firebase_file.write_text(json_dumps(firebase_config), encoding='utf-8')
             
             return {"success": True, "message": "Firebase configuration created"}
             
@@ -233,15 +494,66 @@ class ProjectWizard:
         """Validate GitHub token"""
         if not requests:
             return False
+        
+        # Reuse a recent answer for the same token instead of another round-trip
+        cached = _TOKEN_VALIDATION_CACHE.get(token)
+        if cached and time.monotonic() - cached[0] < TOKEN_VALIDATION_TTL:
+            return cached[1]
+        
         try:
-            response = requests.get(
+            response = self.session.head(
                 "https://api.github.com/user",
                 headers={"Authorization": f"token {token}"}
             )
-            return response.status_code == 200
+            is_valid = response.status_code == 200
+            _TOKEN_VALIDATION_CACHE[token] = (time.monotonic(), is_valid)
+            return is_valid
         except:
             return False
     
+    def _preflight(self, project_name, org_domain, template_repo, template_branch) -> Optional[str]:
+        """Check project inputs and template access; return an error message or None"""
+        if not project_name or not org_domain or not template_repo or not template_branch:
+            return "Missing required fields: name, org_domain, template_repo, template_branch"
+        
+        if not PROJECT_NAME_RE.match(project_name):
+            return "Project name must contain only lowercase letters, numbers, and hyphens"
+        
+        github_token = self.config.get('github_token')
+        if not github_token or github_token == 'your_github_personal_access_token_here':
+            return 'GitHub Personal Access Token not configured'
+        
+        if not requests:
+            return None
+        
+        key = (template_repo, template_branch, hashlib.sha256(github_token.encode()).hexdigest())
+        cached = _PREFLIGHT_CACHE.get(key)
+        if cached and time.monotonic() - cached[0] < PREFLIGHT_TTL:
+            return cached[1]
+        
+        # One request proves the repository, the branch and the token's access to them
+        try:
+            response = self.session.head(
+                f"https://api.github.com/repos/{template_repo}/branches/{template_branch}",
+                headers={"Authorization": f"token {github_token}"},
+                timeout=5
+            )
+        except requests.RequestException as e:
+            print(f"Skipping template check: {e}")
+            return None
+        
+        # Rate limits and server errors are left for the clone to report
+        if response.status_code not in (200, 401, 404):
+            return None
+        if response.status_code == 401:
+            error = 'GitHub Personal Access Token was rejected'
+        elif response.status_code == 404:
+            error = f'Template branch {template_branch} of {template_repo} not found or not accessible'
+        else:
+            error = None
+        _PREFLIGHT_CACHE[key] = (time.monotonic(), error)
+        return error
+    
     def _clone_template_repository(self, temp_dir, template_repo, template_branch):
         """Clone template repository"""
         try:
@@ -254,20 +566,59 @@ class ProjectWizard:
             print(f"Branch: {template_branch}")
             print(f"Target directory: {temp_dir}")
             
-            result = subprocess.run(
-                ['git', 'clone', '--branch', template_branch, clone_url, str(temp_dir)], 
-                check=True, 
-                capture_output=True, 
-                text=True
-            )
-            
-            print(f"Clone successful: {result.stdout}")
+            with _CLONE_SEMAPHORE:
+                try:
+                    self._clone_from_template_cache(temp_dir, clone_url, template_repo, template_branch)
+                except subprocess.CalledProcessError as e:
+                    print(f"Template cache unavailable, cloning directly: {e.stderr}")
+                    # A failure after the local clone (e.g. in remote set-url) leaves a populated checkout behind
+                    shutil.rmtree(temp_dir, ignore_errors=True)
+                    # Only the template branch is needed; the full history is kept because
+                    # it is pushed to the new private repository later on
+                    subprocess.run(
+                        [GIT_BIN, 'clone', '--single-branch', '--no-tags', '--branch', template_branch, clone_url, str(temp_dir)], 
+                        check=True, 
+                        stdout=subprocess.DEVNULL, 
+                        stderr=subprocess.PIPE, 
+                        text=True,
+                        env=GIT_ENV
+                    )
+            
+            print("Clone successful")
             return f'https://github.com/{template_repo}/tree/{template_branch}'
         except subprocess.CalledProcessError as e:
             print(f"Clone failed: {e}")
             print(f"Error output: {e.stderr}")
             raise Exception(f'Failed to clone template repository: {e.stderr}')
     
+    def _clone_from_template_cache(self, temp_dir, clone_url, template_repo, template_branch):
+        """Refresh the local mirror of a template branch and clone the project from it"""
+        cache_dir = TEMPLATE_CACHE_DIR / template_repo.replace('/', '_') / template_branch
+        refspec = f'+refs/heads/{template_branch}:refs/heads/{template_branch}'
+        
+        with _TEMPLATE_CACHE_LOCKS_GUARD:
+            cache_lock = _TEMPLATE_CACHE_LOCKS.setdefault(cache_dir, threading.Lock())
+        
+        with cache_lock:
+            if not (cache_dir / 'HEAD').exists():
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                subprocess.run([GIT_BIN, 'init', '--bare', str(cache_dir)], check=True,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, env=GIT_ENV)
+            
+            # Fetch by URL so the token is never stored in the cache; an up-to-date
+            # cache only exchanges refs here
+            print(f"Updating template cache: {cache_dir}")
+            subprocess.run([GIT_BIN, 'fetch', '--no-tags', clone_url, refspec],
+                           cwd=cache_dir, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, env=GIT_ENV)
+        
+        # A local clone hardlinks objects where possible and stays independent of the cache;
+        # it only reads the mirror, so clones of the same template run concurrently
+        subprocess.run([GIT_BIN, 'clone', '--local', '--branch', template_branch, str(cache_dir), str(temp_dir)],
+                       check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, env=GIT_ENV)
+        
+        subprocess.run([GIT_BIN, 'remote', 'set-url', 'origin', clone_url], cwd=temp_dir, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, env=GIT_ENV)
+    
     def _rename_project_identifiers(self, temp_dir, project_name, org_domain):
         """Rename project identifiers in various files"""
         files_to_update = [
@@ -282,89 +633,48 @@ class ProjectWizard:
             'storage.rules'
         ]
         
+        replacements = {
+            b'com.meghzone.mytemplate-app': f'com.{org_domain}.{project_name}'.encode('utf-8'),
+            b'mytemplate-app': project_name.encode('utf-8')
+        }
+        
         for file_path in files_to_update:
             full_path = temp_dir / file_path
             if full_path.exists():
                 try:
-                    with open(full_path, 'r') as f:
-                        content = f.read()
+                    content = full_path.read_bytes()
                     
-                    # Replace old project name with new one
-                    content = content.replace('mytemplate-app', project_name)
-                    content = content.replace('com.meghzone.mytemplate-app', f'com.{org_domain}.{project_name}')
+                    # Replace old project identifiers in a single pass
+                    new_content = TEMPLATE_IDENTIFIER_RE.sub(lambda match: replacements[match.group(0)], content)
                     
-                    with open(full_path, 'w') as f:
-                        f.write(content)
+                    if new_content != content:
+                        full_path.write_bytes(new_content)
                 except Exception as e:
                     print(f"Warning: Could not update {file_path}: {e}")
     
     def _create_firebase_config_files(self, temp_dir, project_name, org_domain):
         """Create Firebase configuration files"""
-        # Create firebase.json
-        firebase_config = {
-            "firestore": {
-                "rules": "firestore.rules",
-                "indexes": "firestore.indexes.json"
-            },
-            "storage": {
-                "rules": "storage.rules"
-            },
-            "emulators": {
-                "auth": {"port": 9099},
-                "firestore": {"port": 8080},
-                "storage": {"port": 9199},
-                "ui": {"enabled": True}
-            }
-        }
-        
-        with open(temp_dir / 'firebase.json', 'w') as f:
-            json.dump(firebase_config, f, indent=2)
-        
-        # Create firestore.indexes.json
-        firestore_indexes = {"indexes": [], "fieldOverrides": []}
-        with open(temp_dir / 'firestore.indexes.json', 'w') as f:
-            json.dump(firestore_indexes, f, indent=2)
-        
-        # Create Flutter Firebase configuration
-        flutter_firebase_config = f'''import 'package:firebase_core/firebase_core.dart';
-import 'package:cloud_firestore/cloud_firestore.dart';
-import 'package:firebase_storage/firebase_storage.dart';
-
-class FirebaseConfig {{
-  static const String projectId = '{project_name}';
-  static const String storageBucket = '{project_name}.appspot.com';
-  static const String orgDomain = '{org_domain}';
-  
-  static Future<void> initializeFirebase() async {{
-    await Firebase.initializeApp(
-      options: const FirebaseOptions(
-        apiKey: 'YOUR_API_KEY', // Will be replaced with actual config
-        appId: 'YOUR_APP_ID', // Will be replaced with actual config
-        messagingSenderId: 'YOUR_SENDER_ID', // Will be replaced with actual config
-        projectId: projectId,
-        storageBucket: storageBucket,
-      ),
-    );
-  }}
-  
-  static FirebaseFirestore get firestore => FirebaseFirestore.instance;
-  static FirebaseStorage get storage => FirebaseStorage.instance;
-  
-  // Storage root path for the project
-  static String get storageRoot => 'projects/{project_name}';
-}}'''
+        _write_if_changed(temp_dir / 'firebase.json', FIREBASE_JSON)
+        _write_if_changed(temp_dir / 'firestore.indexes.json', FIRESTORE_INDEXES_JSON)
         
         # Create lib/firebase_config.dart
+        flutter_firebase_config = FLUTTER_FIREBASE_CONFIG_TEMPLATE.format_map({
+            'project_name': project_name,
+            'org_domain': org_domain
+        })
         lib_dir = temp_dir / 'lib'
         lib_dir.mkdir(exist_ok=True)
-        with open(lib_dir / 'firebase_config.dart', 'w') as f:
-            f.write(flutter_firebase_config)
+        _write_if_changed(lib_dir / 'firebase_config.dart', flutter_firebase_config)
+    
+    def _run_firebase(self, firebase_account, *args, **kwargs):
+        """Run a Firebase CLI command as the given account"""
+        return subprocess.run([FIREBASE_BIN, '--account', firebase_account, *args], env=FIREBASE_CLI_ENV, **kwargs)
     
     def _create_firebase_project(self, project_name, firebase_account):
         """Create Firebase project"""
         try:
-            import random
-            project_id = f'{project_name}-{random.randint(100000, 999999)}'
+            # 8 hex characters make an ID collision vanishingly unlikely
+            project_id = f'{project_name}-{secrets.token_hex(4)}'
             display_name = project_name if len(project_name) >= 4 else f'{project_name}-project'
             
             print(f"Creating Firebase project: {project_id}")
@@ -373,431 +683,185 @@ class FirebaseConfig {{
             
             # Try multiple times with different project IDs if needed
             for attempt in range(1, 4):
-                current_project_id = project_id if attempt == 1 else f'{project_name}-{random.randint(100000, 999999)}'
+                current_project_id = project_id if attempt == 1 else f'{project_name}-{secrets.token_hex(4)}'
                 
                 try:
                     print(f"Attempt {attempt}: Creating project {current_project_id}")
-                    result = subprocess.run([
-                        'firebase', '--account', firebase_account,
-                        'projects:create', current_project_id,
-                        '--display-name', display_name
-                    ], check=True, capture_output=True, text=True, timeout=120)
+                    self._run_firebase(
+                        firebase_account, 'projects:create', current_project_id, '--display-name', display_name,
+                        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=120)
                     
-                    print(f"Firebase project created successfully: {result.stdout}")
+                    print(f"Firebase project created successfully: {current_project_id}")
                     return current_project_id
                 except subprocess.CalledProcessError as e:
                     print(f"Attempt {attempt} failed: {e}")
                     print(f"Error output: {e.stderr}")
                     if attempt == 3:
                         raise Exception(f'Failed to create Firebase project after 3 attempts: {e.stderr}')
-                    time.sleep(2)
+                    # A taken project ID is retried with a fresh suffix straight away
+                    if 'ALREADY_EXISTS' not in (e.stderr or ''):
+                        time.sleep(retry_delay(attempt))
                 except subprocess.TimeoutExpired:
                     print(f"Attempt {attempt} timed out after 120 seconds")
                     if attempt == 3:
                         raise Exception('Firebase project creation timed out after 3 attempts')
-                    time.sleep(2)
+                    time.sleep(retry_delay(attempt))
             
             raise Exception('Unexpected error in Firebase project creation')
         except Exception as e:
             print(f"Firebase project creation failed: {e}")
             raise Exception(f'Firebase project creation failed: {e}')
     
-    def _create_firebase_apps(self, project_id, project_name, org_domain, firebase_account):
-        """Create Firebase apps for iOS, Android, and Web"""
-        bundle_id = f'com.{org_domain}.{project_name}'
-        results = {'ios': 'unknown', 'android': 'unknown', 'web': 'unknown'}
-        
-        print(f"Creating Firebase apps for project: {project_id}")
-        print(f"Bundle ID: {bundle_id}")
-        print(f"Firebase account: {firebase_account}")
-        
-        # Create iOS app (with longer timeout and better error handling)
-        try:
-            print(f"Creating iOS app: {project_name}-ios")
-            print(f"Bundle ID: {bundle_id}")
-            print(f"Project ID: {project_id}")
-            
-            # Use the same command structure as the original Electron version
-            # Provide empty input via stdin to handle interactive prompts
-            result = subprocess.run([
-                'firebase', '--account', firebase_account,
-                'apps:create', 'ios',
-                f'{project_name}-ios',
-                '--bundle-id', bundle_id,
-                '--project', project_id
-            ], check=True, capture_output=True, text=True, timeout=90, input='\n')
-            print(f"iOS app creation output: {result.stdout}")
-            results['ios'] = self._extract_app_id(result.stdout)
-            print(f"iOS app ID: {results['ios']}")
-        except subprocess.CalledProcessError as e:
-            print(f'Failed to create iOS app: {e}')
-            print(f'Error output: {e.stderr}')
-            print('Continuing without iOS app...')
-        except subprocess.TimeoutExpired:
-            print('iOS app creation timed out after 90 seconds')
-            print('Continuing without iOS app...')
-        except Exception as e:
-            print(f'Unexpected error creating iOS app: {e}')
-            print('Continuing without iOS app...')
-        
-        # Create Android app
-        try:
-            print(f"Creating Android app: {project_name}-android")
-            result = subprocess.run([
-                'firebase', '--account', firebase_account,
-                'apps:create', 'android',
-                f'{project_name}-android',
-                '--package-name', bundle_id,
-                '--project', project_id
-            ], check=True, capture_output=True, text=True, timeout=60)
-            print(f"Android app creation output: {result.stdout}")
-            results['android'] = self._extract_app_id(result.stdout)
-            print(f"Android app ID: {results['android']}")
-        except subprocess.TimeoutExpired:
-            print('Android app creation timed out after 60 seconds')
-        except subprocess.CalledProcessError as e:
-            print(f'Failed to create Android app: {e}')
-            print(f'Error output: {e.stderr}')
-        except Exception as e:
-            print(f'Unexpected error creating Android app: {e}')
-        
-        # Create Web app
-        try:
-            print(f"Creating Web app: {project_name}-web")
-            result = subprocess.run([
-                'firebase', '--account', firebase_account,
-                'apps:create', 'web',
-                f'{project_name}-web',
-                '--project', project_id
-            ], check=True, capture_output=True, text=True, timeout=60)
-            print(f"Web app creation output: {result.stdout}")
-            results['web'] = self._extract_app_id(result.stdout)
-            print(f"Web app ID: {results['web']}")
-        except subprocess.CalledProcessError as e:
-            print(f'Failed to create Web app: {e}')
-            print(f'Error output: {e.stderr}')
-        except subprocess.TimeoutExpired:
-            print('Web app creation timed out after 60 seconds')
-        except Exception as e:
-            print(f'Unexpected error creating Web app: {e}')
-        
-        # Check if at least one app was created successfully
-        successful_apps = sum(1 for id in results.values() if id != 'unknown')
-        print(f"Successfully created {successful_apps} out of 3 apps")
-        print(f"App results: {results}")
-        
-        if successful_apps == 0:
+    def _create_firebase_apps(self, project_id, project_name, org_domain, firebase_account, on_app_created=None, temp_dir=None):
+        """Create Firebase apps for iOS, Android, and Web; on_app_created(platform, app_id) is called as each finishes.
+        With temp_dir, each app's SDK config is downloaded as soon as that app exists"""
+        results = create_firebase_apps(self._run_firebase, project_id, project_name, org_domain, firebase_account,
+                                       project_dir=temp_dir, on_app_created=on_app_created)
+        if all(app_id == 'unknown' for app_id in results.values()):
+            # Don't fail the entire process
             print("Warning: No Firebase apps were created successfully")
             print("Continuing with project creation without Firebase apps...")
-            # Return empty results but don't fail the entire process
-            return {'ios': 'unknown', 'android': 'unknown', 'web': 'unknown'}
-        
         return results
     
-    def _extract_app_id(self, output):
-        """Extract app ID from Firebase CLI output"""
-        print(f"Extracting app ID from output: {output}")
-        
-        # Look for the specific pattern we saw in the test output
-        patterns = [
-            r'App ID: ([0-9]+:[0-9]+:[a-z]+:[a-zA-Z0-9]+)',
-            r'App ID: ([a-zA-Z0-9-]+)',
-            r'([0-9]+:[0-9]+:[a-z]+:[a-zA-Z0-9]+)',
-            r'([a-zA-Z0-9-]{20,})',
-            r'Created app ([a-zA-Z0-9-]+)',
-            r'App created: ([a-zA-Z0-9-]+)',
-            r'App ID ([0-9]+:[0-9]+:[a-z]+:[a-zA-Z0-9]+)',
-            r'App ID ([a-zA-Z0-9-]+)',
-            r'([0-9]+:[0-9]+:[a-z]+:[a-zA-Z0-9]+)',
-            r'([a-zA-Z0-9-]{15,})'
-        ]
-        
-        for i, pattern in enumerate(patterns):
-            match = re.search(pattern, output, re.IGNORECASE)
-            if match and match.group(1):
-                app_id = match.group(1)
-                print(f"Found app ID with pattern {i}: {app_id}")
-                return app_id
-        
-        # Try to extract any long alphanumeric string that looks like an app ID
-        words = output.split()
-        for word in words:
-            if len(word) > 15 and re.match(r'^[a-zA-Z0-9-:]+$', word):
-                print(f"Found potential app ID in word: {word}")
-                return word
-        
-        print("No app ID found in output")
-        return 'unknown'
-    
     def _download_firebase_configs(self, temp_dir, project_id, app_ids, firebase_account):
         """Download Firebase configuration files"""
-        configs = {}
-        
-        print(f"Downloading Firebase configs for project: {project_id}")
-        print(f"App IDs: {app_ids}")
-        
-        # Download iOS config
-        if app_ids['ios'] and app_ids['ios'] != 'unknown':
-            try:
-                print(f"Downloading iOS config for app ID: {app_ids['ios']}")
-                result = subprocess.run([
-                    'firebase', '--account', firebase_account,
-                    'apps:sdkconfig', 'ios', app_ids['ios'], '--project', project_id
-                ], check=True, capture_output=True, text=True, timeout=30)
-                configs['ios'] = result.stdout
-                
-                # Save to ios/Runner/GoogleService-Info.plist
-                ios_dir = temp_dir / 'ios' / 'Runner'
-                ios_dir.mkdir(parents=True, exist_ok=True)
-                with open(ios_dir / 'GoogleService-Info.plist', 'w') as f:
-                    f.write(result.stdout)
-                print("✅ iOS config downloaded successfully")
-            except subprocess.CalledProcessError as e:
-                print(f'Failed to download iOS config: {e}')
-            except subprocess.TimeoutExpired:
-                print('iOS config download timed out')
-        else:
-            print("⏭️ Skipping iOS config download (no valid app ID)")
-        
-        # Download Android config
-        if app_ids['android'] and app_ids['android'] != 'unknown':
-            try:
-                print(f"Downloading Android config for app ID: {app_ids['android']}")
-                result = subprocess.run([
-                    'firebase', '--account', firebase_account,
-                    'apps:sdkconfig', 'android', app_ids['android'], '--project', project_id
-                ], check=True, capture_output=True, text=True, timeout=30)
-                configs['android'] = result.stdout
-                
-                # Save to android/app/google-services.json
-                android_dir = temp_dir / 'android' / 'app'
-                android_dir.mkdir(parents=True, exist_ok=True)
-                with open(android_dir / 'google-services.json', 'w') as f:
-                    f.write(result.stdout)
-                print("✅ Android config downloaded successfully")
-            except subprocess.CalledProcessError as e:
-                print(f'Failed to download Android config: {e}')
-            except subprocess.TimeoutExpired:
-                print('Android config download timed out')
-        else:
-            print("⏭️ Skipping Android config download (no valid app ID)")
-        
-        # Download Web config
-        if app_ids['web'] and app_ids['web'] != 'unknown':
-            try:
-                print(f"Downloading Web config for app ID: {app_ids['web']}")
-                result = subprocess.run([
-                    'firebase', '--account', firebase_account,
-                    'apps:sdkconfig', 'web', app_ids['web'], '--project', project_id
-                ], check=True, capture_output=True, text=True, timeout=30)
-                configs['web'] = result.stdout
-                
-                # Save to web/firebase-config.js
-                web_dir = temp_dir / 'web'
-                web_dir.mkdir(exist_ok=True)
-                with open(web_dir / 'firebase-config.js', 'w') as f:
-                    f.write(result.stdout)
-                print("✅ Web config downloaded successfully")
-            except subprocess.CalledProcessError as e:
-                print(f'Failed to download Web config: {e}')
-            except subprocess.TimeoutExpired:
-                print('Web config download timed out')
-        else:
-            print("⏭️ Skipping Web config download (no valid app ID)")
-        
-        print(f"Downloaded configs: {list(configs.keys())}")
-        return configs
+        return download_firebase_configs(self._run_firebase, temp_dir, project_id, app_ids, firebase_account)
+    
+    def _read_cached(self, path: Path) -> Optional[bytes]:
+        """Read a file's bytes, reusing the last read while its mtime and size are unchanged; None if missing"""
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        cached = self._file_cache.get(str(path))
+        if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+        data = path.read_bytes()
+        self._file_cache[str(path)] = (st.st_mtime_ns, st.st_size, data)
+        return data
     
     def _update_app_config_json(self, temp_dir, project_id, project_name, org_domain, app_ids):
         """Update app_config.json with Firebase configuration"""
-        config_path = temp_dir / 'assets' / 'config' / 'app_config.json'
-        if not config_path.exists():
+        config_path = temp_dir / APP_CONFIG_JSON_PATH
+        config_data = self._read_cached(config_path)
+        if config_data is None:
             print('app_config.json not found, skipping update')
             return
         
         try:
-            with open(config_path, 'r') as f:
-                existing_config = json.load(f)
+            existing_config = json_loads(config_data)
             
             # Update app name
             if 'app' in existing_config and 'name' in existing_config['app']:
                 existing_config['app']['name'] = project_name
             
             # Update Firebase configuration
-            if 'firebase' not in existing_config:
-                existing_config['firebase'] = {}
+            firebase_config = existing_config.setdefault('firebase', {})
             
             # Update iOS config
             if app_ids['ios'] and app_ids['ios'] != 'unknown':
-                ios_config_path = temp_dir / 'ios' / 'Runner' / 'GoogleService-Info.plist'
-                if ios_config_path.exists():
-                    with open(ios_config_path, 'r') as f:
-                        ios_content = f.read()
-                    
-                    if 'firebase' not in existing_config:
-                        existing_config['firebase'] = {}
-                    if 'ios' not in existing_config['firebase']:
-                        existing_config['firebase']['ios'] = {}
+                ios_config_data = self._read_cached(temp_dir / FIREBASE_CONFIG_PATHS['ios'])
+                if ios_config_data is not None:
+                    ios_cfg = firebase_config.setdefault('ios', {})
                     
                     # Extract values from plist
-                    api_key_match = re.search(r'<key>API_KEY</key>\s*<string>([^<]+)</string>', ios_content)
-                    sender_id_match = re.search(r'<key>GCM_SENDER_ID</key>\s*<string>([^<]+)</string>', ios_content)
-                    app_id_match = re.search(r'<key>GOOGLE_APP_ID</key>\s*<string>([^<]+)</string>', ios_content)
+                    try:
+                        plist = plistlib.loads(ios_config_data)
+                    except Exception as e:
+                        print(f'Could not parse GoogleService-Info.plist: {e}')
+                        plist = {}
                     
-                    if api_key_match:
-                        existing_config['firebase']['ios']['apiKey'] = api_key_match.group(1)
-                    if sender_id_match:
-                        existing_config['firebase']['ios']['messagingSenderId'] = sender_id_match.group(1)
-                    if app_id_match:
-                        existing_config['firebase']['ios']['appId'] = app_id_match.group(1)
+                    for plist_key, config_key in PLIST_CONFIG_KEYS.items():
+                        if plist.get(plist_key):
+                            ios_cfg[config_key] = plist[plist_key]
                     
-                    existing_config['firebase']['ios']['projectId'] = project_id
-                    existing_config['firebase']['ios']['storageBucket'] = f'{project_id}.firebasestorage.app'
-                    existing_config['firebase']['ios']['iosBundleId'] = f'com.{org_domain}.{project_name}'
+                    ios_cfg['projectId'] = project_id
+                    ios_cfg['storageBucket'] = f'{project_id}.firebasestorage.app'
+                    ios_cfg['iosBundleId'] = f'com.{org_domain}.{project_name}'
             
             # Update Android config
             if app_ids['android'] and app_ids['android'] != 'unknown':
-                android_config_path = temp_dir / 'android' / 'app' / 'google-services.json'
-                if android_config_path.exists():
-                    with open(android_config_path, 'r') as f:
-                        android_config = json.load(f)
+                android_config_data = self._read_cached(temp_dir / FIREBASE_CONFIG_PATHS['android'])
+                if android_config_data is not None:
+                    android_config = json_loads(android_config_data)
                     
-                    if 'firebase' not in existing_config:
-                        existing_config['firebase'] = {}
-                    if 'android' not in existing_config['firebase']:
-                        existing_config['firebase']['android'] = {}
+                    android_cfg = firebase_config.setdefault('android', {})
                     
                     if 'project_info' in android_config:
-                        existing_config['firebase']['android']['apiKey'] = android_config['project_info'].get('api_key')
-                        existing_config['firebase']['android']['messagingSenderId'] = android_config['project_info'].get('project_number')
+                        android_cfg['apiKey'] = android_config['project_info'].get('api_key')
+                        android_cfg['messagingSenderId'] = android_config['project_info'].get('project_number')
                     
                     if 'client' in android_config and android_config['client']:
-                        existing_config['firebase']['android']['appId'] = android_config['client'][0].get('client_info', {}).get('mobilesdk_app_id')
+                        android_cfg['appId'] = android_config['client'][0].get('client_info', {}).get('mobilesdk_app_id')
                     
-                    existing_config['firebase']['android']['projectId'] = project_id
-                    existing_config['firebase']['android']['storageBucket'] = f'{project_id}.firebasestorage.app'
+                    android_cfg['projectId'] = project_id
+                    android_cfg['storageBucket'] = f'{project_id}.firebasestorage.app'
             
             # Update Web config
             if app_ids['web'] and app_ids['web'] != 'unknown':
-                web_config_path = temp_dir / 'web' / 'firebase-config.js'
-                if web_config_path.exists():
-                    with open(web_config_path, 'r') as f:
-                        web_content = f.read()
+                web_config_data = self._read_cached(temp_dir / FIREBASE_CONFIG_PATHS['web'])
+                if web_config_data is not None:
+                    web_content = web_config_data.decode('utf-8')
                     
-                    if 'firebase' not in existing_config:
-                        existing_config['firebase'] = {}
-                    if 'web' not in existing_config['firebase']:
-                        existing_config['firebase']['web'] = {}
+                    web_cfg = firebase_config.setdefault('web', {})
                     
-                    # Extract values from web config
-                    patterns = {
-                        'apiKey': r'"apiKey":\s*"([^"]+)"',
-                        'authDomain': r'"authDomain":\s*"([^"]+)"',
-                        'projectId': r'"projectId":\s*"([^"]+)"',
-                        'storageBucket': r'"storageBucket":\s*"([^"]+)"',
-                        'messagingSenderId': r'"messagingSenderId":\s*"([^"]+)"',
-                        'appId': r'"appId":\s*"([^"]+)"',
-                        'measurementId': r'"measurementId":\s*"([^"]+)"'
-                    }
-                    
-                    for key, pattern in patterns.items():
-                        match = re.search(pattern, web_content)
-                        if match:
-                            existing_config['firebase']['web'][key] = match.group(1)
+                    # Extract values from web config: the sdkconfig snippet wraps a
+                    # JSON object literal in an initializeApp() call
+                    try:
+                        web_object = json_loads(web_content[web_content.find('{'):web_content.rfind('}') + 1])
+                        web_values = {key: web_object[key] for key in WEB_CONFIG_KEYS if key in web_object}
+                    except ValueError:
+                        # Not JSON after all; the first occurrence of a key wins
+                        web_values = {}
+                        for match in WEB_CONFIG_RE.finditer(web_content):
+                            web_values.setdefault(match.group('key'), match.group('value'))
+                    web_cfg.update(web_values)
             
             # Write updated configuration
-            with open(config_path, 'w') as f:
-                json.dump(existing_config, f, indent=2)
+            config_json = json_dumps(existing_config)
+            _write_if_changed(config_path, config_json)
             
             # Create TypeScript interface file
             lib_dir = temp_dir / 'lib'
             lib_dir.mkdir(exist_ok=True)
             
-            typescript_interface = f'''// Auto-generated Firebase app configuration types
-export interface FirebaseAppConfig {{
-  app?: {{
-    name?: string;
-    description?: string;
-    version?: string;
-    buildNumber?: string;
-  }};
-  firebase?: {{
-    web?: {{
-      apiKey?: string;
-      appId?: string;
-      messagingSenderId?: string;
-      projectId?: string;
-      authDomain?: string;
-      storageBucket?: string;
-      measurementId?: string;
-    }};
-    android?: {{
-      apiKey?: string;
-      appId?: string;
-      messagingSenderId?: string;
-      projectId?: string;
-      storageBucket?: string;
-    }};
-    ios?: {{
-      apiKey?: string;
-      appId?: string;
-      messagingSenderId?: string;
-      projectId?: string;
-      storageBucket?: string;
-      iosBundleId?: string;
-    }};
-  }};
-  assets?: any;
-  features?: any;
-  api?: any;
-  ui?: any;
-  localization?: any;
-}}
-
-// Import the configuration from assets/config/app_config.json
-export const appConfig: FirebaseAppConfig = {json.dumps(existing_config, indent=2)};
-'''
-            
-            with open(lib_dir / 'app_config.ts', 'w') as f:
-                f.write(typescript_interface)
+            # Reuses the JSON already encoded (by orjson when installed) for app_config.json
+            with open(lib_dir / 'app_config.ts', 'w', encoding='utf-8') as f:
+                f.write(APP_CONFIG_TS_PRELUDE)
+                f.write(config_json)
+                f.write(APP_CONFIG_TS_EPILOGUE)
                 
         except Exception as e:
             print(f'Failed to update app_config.json: {e}')
     
-    def _setup_firestore_database(self, project_id, project_name, firebase_account):
+    def _setup_firestore_database(self, temp_dir, project_id, project_name, firebase_account):
         """Setup Firestore database"""
         try:
             print(f"Setting up Firestore database for project: {project_id}")
             
-            # Check if database already exists
-            try:
-                result = subprocess.run([
-                    'firebase', '--account', firebase_account,
-                    'firestore:databases:list', '--project', project_id
-                ], check=True, capture_output=True, text=True, timeout=30)
-                
-                if 'default' in result.stdout:
-                    print("Firestore database 'default' already exists")
-                    return
-            except subprocess.CalledProcessError:
-                pass  # Continue with creation
-            
-            # Create Firestore database
+            # Create Firestore database; an existing one is reported by the create call
+            # itself, which saves a separate CLI launch to list databases first
             print("Creating Firestore database...")
-            result = subprocess.run([
-                'firebase', '--account', firebase_account,
-                'firestore:databases:create', 'default',
-                '--location', 'us-central1', '--project', project_id
-            ], check=True, capture_output=True, text=True, timeout=60)
+            try:
+                self._run_firebase(
+                    firebase_account, 'firestore:databases:create', 'default', '--location', 'us-central1', '--project', project_id,
+                    check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=60)
+            except subprocess.CalledProcessError as e:
+                if 'ALREADY_EXISTS' not in (e.stderr or '') and 'already exists' not in (e.stderr or ''):
+                    raise
+                print("Firestore database 'default' already exists")
+                return
             
             print("Firestore database created successfully")
             
-            # Create firestore.rules file
+            # Create firestore.rules file; a Feb 29 creation date expires on Feb 28
+            today = datetime.now().date()
+            expiry = today.replace(year=today.year + 1, day=28 if (today.month, today.day) == (2, 29) else today.day)
             firestore_rules = f'''rules_version = '2';
 service cloud.firestore {{
   match /databases/{{database}}/documents {{
     // Allow read/write access for testing until 1 year from creation date
-    // This rule expires on {datetime.now().replace(year=datetime.now().year + 1).strftime("%Y-%m-%d")}
+    // This rule expires on {expiry.isoformat()}
     
     // Allow all operations for testing (will be restricted after 1 year)
     match /{{document=**}} {{
@@ -816,17 +880,16 @@ service cloud.firestore {{
   }}
 }}'''
             
-            with open('firestore.rules', 'w') as f:
-                f.write(firestore_rules)
+            # The project's firebase.json already points its firestore rules here
+            _write_if_changed(temp_dir / 'firestore.rules', firestore_rules)
             
             print("Firestore rules file created")
             
-            # Deploy Firestore rules
+            # Deploy Firestore rules; deploy needs the project's firebase.json
             print("Deploying Firestore rules...")
-            subprocess.run([
-                'firebase', '--account', firebase_account,
-                'deploy', '--only', 'firestore:rules', '--project', project_id
-            ], check=True, capture_output=True, text=True, timeout=60)
+            self._run_firebase(
+                firebase_account, 'deploy', '--only', 'firestore:rules', '--project', project_id,
+                cwd=temp_dir, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=60)
             
             print("Firestore rules deployed successfully")
             
@@ -843,28 +906,32 @@ service cloud.firestore {{
     
     def _commit_and_push_changes(self, temp_dir, project_name):
         """Commit and push changes"""
+        commit_message = f'Setup {project_name} with Firebase configuration - {datetime.now().isoformat()}'
         try:
-            subprocess.run(['git', 'add', '.'], cwd=temp_dir, check=True)
-            
-            # Check if there are changes to commit
-            result = subprocess.run(['git', 'status', '--porcelain'], cwd=temp_dir, capture_output=True, text=True)
-            if result.stdout.strip():
-                commit_message = f'Setup {project_name} with Firebase configuration - {datetime.now().isoformat()}'
-                subprocess.run(['git', 'commit', '-m', commit_message], cwd=temp_dir, check=True)
-                print('Changes committed successfully')
+            if PYGIT2_AVAILABLE:
+                # Stage, compare and commit in-process instead of three git subprocesses
+                committed = git_commit_all(temp_dir, commit_message) is not None
             else:
-                print('No changes to commit')
+                subprocess.run([GIT_BIN, 'add', '.'], cwd=temp_dir, check=True, env=GIT_ENV)
                 
-        except subprocess.CalledProcessError as e:
+                # Check if there are staged changes; unlike status this skips the working tree scan
+                result = subprocess.run([GIT_BIN, 'diff', '--cached', '--quiet'], cwd=temp_dir, env=GIT_ENV)
+                committed = result.returncode != 0
+                if committed:
+                    subprocess.run([GIT_BIN, 'commit', '-m', commit_message], cwd=temp_dir, check=True, env=GIT_ENV)
+            
+            print('Changes committed successfully' if committed else 'No changes to commit')
+        
+        except Exception as e:
             raise Exception(f'Failed to commit changes: {e}')
     
-    def _create_private_repository(self, temp_dir, project_name):
-        """Create new private repository"""
+    def _create_github_repository(self, project_name) -> Optional[Dict[str, Any]]:
+        """Create the empty private GitHub repository; return its API data or None"""
         try:
             github_token = self.config.get('github_token')
             if not github_token or github_token == 'your_github_personal_access_token_here':
                 print('Skipping private repository creation - no valid GitHub token')
-                return ''
+                return None
             
             repo_data = {
                 'name': project_name,
@@ -873,14 +940,9 @@ service cloud.firestore {{
                 'auto_init': False
             }
             
-            response = requests.post(
+            response = self.session.post(
                 'https://api.github.com/user/repos',
-                headers={
-                    'Authorization': f'token {github_token}',
-                    'Accept': 'application/vnd.github.v3+json',
-                    'Content-Type': 'application/json',
-                    'User-Agent': 'Project-Wizard'
-                },
+                headers={'Authorization': f'token {github_token}'},
                 json=repo_data
             )
             
@@ -888,48 +950,89 @@ service cloud.firestore {{
                 error_data = response.json()
                 raise Exception(f'Failed to create repository: {error_data.get("message", response.status_text)}')
             
-            repo = response.json()
-            new_repo_url = repo['clone_url']
-            new_repo_name = repo['full_name']
+            # The cached repository listings no longer include the new repository
+            for key in [key for key in _GITHUB_LIST_CACHE if key[0] == 'https://api.github.com/user/repos']:
+                _GITHUB_LIST_CACHE.pop(key, None)
             
+            return response.json()
+            
+        except Exception as e:
+            print(f'Failed to create private repository: {e}')
+            return None
+    
+    def _delete_github_repository(self, repo):
+        """Delete a repository from _create_github_repository, or from a future of it, after a failed run"""
+        if isinstance(repo, Future):
+            try:
+                repo = repo.result()
+            except Exception:
+                return
+        if not repo:
+            return
+        
+        try:
+            response = self.session.delete(
+                repo['url'],
+                headers={'Authorization': f'token {self.config.get("github_token")}'},
+                timeout=30
+            )
+            if response.ok:
+                print(f'Deleted unused repository {repo["full_name"]}')
+            else:
+                print(f'Could not delete unused repository {repo["full_name"]}: {response.status_code}')
+        except Exception as e:
+            print(f'Could not delete unused repository {repo["full_name"]}: {e}')
+    
+    def _push_to_private_repository(self, temp_dir, repo) -> str:
+        """Push the project to a repository from _create_github_repository; return its URL or ''"""
+        if not repo:
+            return ''
+        
+        try:
             # Add new remote and push
-            subprocess.run(['git', 'remote', 'add', 'new-origin', new_repo_url], cwd=temp_dir, check=True)
-            subprocess.run(['git', 'push', 'new-origin', 'main'], cwd=temp_dir, check=True)
+            subprocess.run([GIT_BIN, 'remote', 'add', 'new-origin', repo['clone_url']], cwd=temp_dir, check=True, env=GIT_ENV)
+            # --follow-tags sends the base build tag in the same push
+            subprocess.run([GIT_BIN, 'push', '--follow-tags', 'new-origin', 'main'], cwd=temp_dir, check=True, env=GIT_ENV)
             
-            return f'https://github.com/{new_repo_name}'
+            return f'https://github.com/{repo["full_name"]}'
             
         except Exception as e:
-            print(f'Failed to create private repository: {e}')
+            print(f'Failed to push to private repository: {e}')
+            # An empty repository would block a retry with the same name
+            self._delete_github_repository(repo)
             return ''
     
-    def _create_base_build_tag(self, temp_dir, project_name):
-        """Create base build tag"""
+    def _create_base_build_tag(self, temp_dir, project_name) -> Optional[str]:
+        """Create base build tag; return the tag name actually used, or None on failure"""
         try:
-            date_str = datetime.now().strftime('%Y-%m-%d')
-            timestamp = datetime.now().isoformat()
+            # One clock read, so the tag name and message can't straddle midnight
+            now = datetime.now()
+            date_str = now.strftime('%Y-%m-%d')
             tag_name = f'base-build-{date_str}'
-            tag_message = f'Base build for {project_name} - {timestamp}'
+            tag_message = f'Base build for {project_name} - {now.isoformat()}'
             
-            # Check if tag already exists
-            try:
-                subprocess.run(['git', 'rev-parse', tag_name], cwd=temp_dir, check=True, capture_output=True)
+            # Check if tag already exists, as a loose ref or in packed-refs
+            git_dir = Path(temp_dir) / '.git'
+            packed_refs = git_dir / 'packed-refs'
+            if (git_dir / 'refs' / 'tags' / tag_name).exists() or (
+                    packed_refs.exists() and f' refs/tags/{tag_name}\n' in packed_refs.read_text()):
                 # Tag exists, create a unique one with timestamp
-                tag_name = f'base-build-{date_str}-{int(time.time())}'
-                print(f'Tag {tag_name} already exists, creating unique tag: {tag_name}')
-            except subprocess.CalledProcessError:
+                unique_tag = f'{tag_name}-{int(now.timestamp())}'
+                print(f'Tag {tag_name} already exists, creating unique tag: {unique_tag}')
+                tag_name = unique_tag
+            else:
                 # Tag doesn't exist, we can use the original name
                 print(f'Creating base build tag: {tag_name}')
             
-            # Create annotated tag
-            subprocess.run(['git', 'tag', '-a', tag_name, '-m', tag_message], cwd=temp_dir, check=True)
-            
-            # Push the tag
-            subprocess.run(['git', 'push', 'origin', tag_name], cwd=temp_dir, check=True)
+            # Create annotated tag; it is pushed along with main by _push_to_private_repository
+            subprocess.run([GIT_BIN, 'tag', '-a', tag_name, '-m', tag_message], cwd=temp_dir, check=True, env=GIT_ENV)
             
-            print(f'Base build tag created and pushed: {tag_name}')
+            print(f'Base build tag created: {tag_name}')
+            return tag_name
             
         except subprocess.CalledProcessError as e:
             print(f'Failed to create base build tag: {e}')
+            return None
     
     def get_github_repositories(self):
         """Get GitHub repositories for the user"""
@@ -938,20 +1041,8 @@ service cloud.firestore {{
             if not github_token or github_token == 'your_github_personal_access_token_here':
                 return []
             
-            response = requests.get(
-                'https://api.github.com/user/repos',
-                headers={
-                    'Authorization': f'token {github_token}',
-                    'Accept': 'application/vnd.github.v3+json',
-                    'User-Agent': 'Project-Wizard'
-                }
-            )
-            
-            if response.ok:
-                repos = response.json()
-                return [{'name': repo['name'], 'full_name': repo['full_name'], 'default_branch': repo['default_branch']} for repo in repos]
-            else:
-                return []
+            repos = self._github_get_all_pages('https://api.github.com/user/repos', github_token)
+            return [{'name': repo['name'], 'full_name': repo['full_name'], 'default_branch': repo['default_branch']} for repo in repos]
         except Exception as e:
             print(f'Failed to fetch GitHub repositories: {e}')
             return []
@@ -964,24 +1055,49 @@ service cloud.firestore {{
                 return []
             
             # Use the correct API endpoint for repository branches
-            response = requests.get(
-                f'https://api.github.com/repos/{repo_full_name}/branches',
-                headers={
-                    'Authorization': f'token {github_token}',
-                    'Accept': 'application/vnd.github.v3+json',
-                    'User-Agent': 'Project-Wizard'
-                }
-            )
-            
-            if response.ok:
-                branches = response.json()
-                return [{'name': branch['name']} for branch in branches]
-            else:
-                print(f'Failed to fetch branches for {repo_full_name}: {response.status_code} - {response.text}')
-                return []
+            branches = self._github_get_all_pages(f'https://api.github.com/repos/{repo_full_name}/branches', github_token)
+            return [{'name': branch['name']} for branch in branches]
         except Exception as e:
-            print(f'Failed to fetch GitHub branches: {e}')
+            print(f'Failed to fetch branches for {repo_full_name}: {e}')
             return []
+    
+    def _github_get_all_pages(self, url, github_token) -> List[Dict[str, Any]]:
+        """Fetch every item of a GitHub list endpoint, reusing a recent listing"""
+        key = (url, hashlib.sha256(github_token.encode()).hexdigest())
+        cached = _GITHUB_LIST_CACHE.get(key)
+        if cached and time.monotonic() - cached[0] < GITHUB_LIST_TTL:
+            return [item for _, items in cached[1] for item in items]
+        
+        # Expired pages are revalidated by ETag; a 304 has no body and does not
+        # count against the rate limit
+        cached_pages = cached[1] if cached else []
+        headers = {'Authorization': f'token {github_token}'}
+        
+        def fetch_page(page):
+            cached_page = cached_pages[page - 1] if page <= len(cached_pages) else None
+            page_headers = dict(headers, **{'If-None-Match': cached_page[0]}) if cached_page and cached_page[0] else headers
+            response = self.session.get(url, headers=page_headers, params={'per_page': GITHUB_PER_PAGE, 'page': page})
+            if response.status_code == 304:
+                return response, cached_page
+            response.raise_for_status()
+            return response, (response.headers.get('ETag'), response.json())
+        
+        response, first_page = fetch_page(1)
+        pages = [first_page]
+        
+        # The Link header names the last page, so the rest can be requested at once;
+        # a 304 without one keeps the cached page count
+        last = response.links.get('last')
+        if last:
+            last_page = int(parse_qs(urlparse(last['url']).query)['page'][0])
+        else:
+            last_page = len(cached_pages) if response.status_code == 304 else 1
+        
+        with ThreadPoolExecutor(max_workers=GITHUB_PAGE_WORKERS) as executor:
+            pages.extend(page for _, page in executor.map(fetch_page, range(2, last_page + 1)))
+        
+        _GITHUB_LIST_CACHE[key] = (time.monotonic(), pages)
+        return [item for _, items in pages for item in items]
 
 class PyQtWizard(QMainWindow):
     """PyQt-based GUI for the project wizard"""
@@ -1243,17 +1359,22 @@ class PyQtWizard(QMainWindow):
         self.create_thread.progress_update.connect(self.update_progress)
         self.create_thread.start()
     
-    def update_progress(self, message):
-        """Update progress display"""
-        self.output_text.append(message)
+    def update_progress(self, messages):
+        """Update progress display with a batch of messages"""
+        # Lay out and repaint once for the whole batch
+        self.output_text.setUpdatesEnabled(False)
+        for message in messages:
+            self.output_text.append(message)
+        self.output_text.setUpdatesEnabled(True)
         # Auto-scroll to bottom
-        self.output_text.verticalScrollBar().setValue(self.output_text.verticalScrollBar().maximum())
+        self.output_text.moveCursor(QTextCursor.MoveOperation.End)
     
     def on_project_created(self, result):
         """Handle project creation result"""
         self.progress_bar.setVisible(False)
         
         if result['success']:
+            self.output_text.setUpdatesEnabled(False)
             self.output_text.append(f"✅ {result['message']}")
             self.output_text.append(f"Project created at: {result['project_path']}")
             
@@ -1266,6 +1387,8 @@ class PyQtWizard(QMainWindow):
                 self.output_text.append(f"New Repository: {result['new_repo_url']}")
             if result.get('base_build_tag'):
                 self.output_text.append(f"Base Build Tag: {result['base_build_tag']}")
+            self.output_text.setUpdatesEnabled(True)
+            self.output_text.moveCursor(QTextCursor.MoveOperation.End)
             
             # Ask if user wants to open the project
             reply = QMessageBox.question(
@@ -1316,20 +1439,40 @@ class PyQtWizard(QMainWindow):
 class CreateProjectThread(QThread):
     """Thread for creating projects with detailed progress tracking"""
     result_ready = pyqtSignal(dict)
-    progress_update = pyqtSignal(str)
+    progress_update = pyqtSignal(list)
     
     def __init__(self, wizard, project_data):
         super().__init__()
         self.wizard = wizard
         self.project_data = project_data
+        self._pending_progress = []
+    
+    def _report(self, message, flush=True):
+        """Queue a progress message; flush=False for messages followed at once by another"""
+        self._pending_progress.append(message)
+        if flush:
+            self._flush_progress()
+    
+    def _report_app_created(self, platform, app_id):
+        """Report each Firebase app as soon as its creation finishes"""
+        if app_id == 'unknown':
+            self._report(f"⚠️ {PLATFORM_LABELS[platform]} app could not be created")
+        else:
+            self._report(f"✅ {PLATFORM_LABELS[platform]} app created: {app_id}")
+    
+    def _flush_progress(self):
+        """Send queued progress messages to the GUI as one signal"""
+        if self._pending_progress:
+            self.progress_update.emit(self._pending_progress)
+            self._pending_progress = []
     
     def run(self):
         """Run project creation in background thread with detailed progress"""
         try:
-            self.progress_update.emit("🚀 Starting project creation...")
+            self._report("🚀 Starting project creation...", flush=False)
             
             # Step 1: Validate project data
-            self.progress_update.emit("📋 Validating project data...")
+            self._report("📋 Validating project data...", flush=False)
             project_name = self.project_data.get('name', '')
             org_domain = self.project_data.get('org_domain', '')
             template_repo = self.project_data.get('template_repo', '')
@@ -1337,102 +1480,105 @@ class CreateProjectThread(QThread):
             firebase_account = self.project_data.get('firebase_account', '')
             
             if not project_name or not org_domain or not template_repo or not template_branch:
+                self._flush_progress()
                 self.result_ready.emit({"success": False, "error": "Missing required fields"})
                 return
             
             # Step 2: Create temporary directory
-            self.progress_update.emit("📁 Creating temporary workspace...")
-            import tempfile
-            temp_dir = Path(tempfile.mkdtemp(prefix=f'{project_name}-'))
-            self.progress_update.emit(f"📁 Temporary directory: {temp_dir}")
+            self._report("📁 Creating temporary workspace...", flush=False)
+            PROJECTS_DIR.mkdir(exist_ok=True)
+            temp_dir = Path(tempfile.mkdtemp(prefix=f'.{project_name}-', dir=PROJECTS_DIR))
+            self._report(f"📁 Temporary directory: {temp_dir}", flush=False)
             
+            # Pending GitHub repository, deleted again if a step before the push fails
+            private_repo = None
             try:
                 # Step 3: Clone template repository
-                self.progress_update.emit(f"📥 Cloning template repository: {template_repo} (branch: {template_branch})")
+                self._report(f"📥 Cloning template repository: {template_repo} (branch: {template_branch})")
                 github_url = self.wizard._clone_template_repository(temp_dir, template_repo, template_branch)
-                self.progress_update.emit(f"✅ Repository cloned successfully: {github_url}")
+                self._report(f"✅ Repository cloned successfully: {github_url}", flush=False)
+                
+                # The empty GitHub repository does not depend on the project contents, so
+                # it is created in the background and pushed to once the project is ready
+                repo_executor = ThreadPoolExecutor(max_workers=1)
+                private_repo = repo_executor.submit(self.wizard._create_github_repository, project_name)
+                repo_executor.shutdown(wait=False)
                 
                 # Step 4: Rename project identifiers
-                self.progress_update.emit("🔄 Renaming project identifiers...")
+                self._report("🔄 Renaming project identifiers...")
                 self.wizard._rename_project_identifiers(temp_dir, project_name, org_domain)
-                self.progress_update.emit("✅ Project identifiers updated")
+                self._report("✅ Project identifiers updated", flush=False)
                 
                 # Step 5: Create Firebase configuration files
-                self.progress_update.emit("📝 Creating Firebase configuration files...")
+                self._report("📝 Creating Firebase configuration files...")
                 self.wizard._create_firebase_config_files(temp_dir, project_name, org_domain)
-                self.progress_update.emit("✅ Firebase configuration files created")
+                self._report("✅ Firebase configuration files created", flush=False)
                 
                 # Step 6: Create Firebase project (if requested)
                 firebase_project_id = None
                 app_ids = None
                 if self.project_data.get('setup_firebase', False) and firebase_account:
-                    self.progress_update.emit(f"🔥 Creating Firebase project: {project_name}")
+                    self._report(f"🔥 Creating Firebase project: {project_name}")
                     firebase_project_id = self.wizard._create_firebase_project(project_name, firebase_account)
-                    self.progress_update.emit(f"✅ Firebase project created: {firebase_project_id}")
-                    
-                    # Step 7: Create Firebase apps
-                    self.progress_update.emit("📱 Creating Firebase apps (iOS, Android, Web)...")
-                    app_ids = self.wizard._create_firebase_apps(firebase_project_id, project_name, org_domain, firebase_account)
-                    self.progress_update.emit(f"✅ Firebase apps created: {app_ids}")
-                    
-                    # Step 8: Setup Firestore database
-                    self.progress_update.emit("🗄️ Setting up Firestore database...")
-                    self.wizard._setup_firestore_database(firebase_project_id, project_name, firebase_account)
-                    self.progress_update.emit("✅ Firestore database configured")
-                    
-                    # Step 9: Download Firebase config files
-                    self.progress_update.emit("⬇️ Downloading Firebase configuration files...")
-                    self.wizard._download_firebase_configs(temp_dir, firebase_project_id, app_ids, firebase_account)
-                    self.progress_update.emit("✅ Firebase config files downloaded")
+                    self._report(f"✅ Firebase project created: {firebase_project_id}", flush=False)
                     
-                    # Step 10: Update app_config.json
-                    self.progress_update.emit("⚙️ Updating app configuration with Firebase data...")
-                    self.wizard._update_app_config_json(temp_dir, firebase_project_id, project_name, org_domain, app_ids)
-                    self.progress_update.emit("✅ App configuration updated")
+                    with ThreadPoolExecutor(max_workers=1) as executor:
+                        # Step 7: Setup Firestore database; it only needs the project,
+                        # so it runs while the apps are created and configured
+                        self._report("🗄️ Setting up Firestore database...", flush=False)
+                        firestore_setup = executor.submit(self.wizard._setup_firestore_database, temp_dir, firebase_project_id, project_name, firebase_account)
+                        
+                        # Steps 8-9: Create Firebase apps, downloading each config as its app is ready
+                        self._report("📱 Creating Firebase apps (iOS, Android, Web)...", flush=False)
+                        self._report("⬇️ Downloading Firebase configuration files...")
+                        app_ids = self.wizard._create_firebase_apps(
+                            firebase_project_id, project_name, org_domain, firebase_account,
+                            on_app_created=self._report_app_created, temp_dir=temp_dir)
+                        self._report(f"✅ Firebase apps created: {app_ids}", flush=False)
+                        self._report("✅ Firebase config files downloaded", flush=False)
+                        
+                        # Step 10: Update app_config.json
+                        self._report("⚙️ Updating app configuration with Firebase data...")
+                        self.wizard._update_app_config_json(temp_dir, firebase_project_id, project_name, org_domain, app_ids)
+                        self._report("✅ App configuration updated")
+                        
+                        firestore_setup.result()
+                        self._report("✅ Firestore database configured", flush=False)
                 else:
-                    self.progress_update.emit("⏭️ Skipping Firebase setup (not requested)")
+                    self._report("⏭️ Skipping Firebase setup (not requested)", flush=False)
                 
                 # Step 11: Commit changes
-                self.progress_update.emit("💾 Committing project changes...")
+                self._report("💾 Committing project changes...")
                 self.wizard._commit_and_push_changes(temp_dir, project_name)
-                self.progress_update.emit("✅ Changes committed")
+                self._report("✅ Changes committed", flush=False)
                 
-                # Step 12: Create new private repository
-                self.progress_update.emit("🆕 Creating new private repository...")
-                new_repo_url = self.wizard._create_private_repository(temp_dir, project_name)
-                if new_repo_url:
-                    self.progress_update.emit(f"✅ Private repository created: {new_repo_url}")
+                # Step 12: Create base build tag
+                self._report("🏷️ Creating base build tag...")
+                base_build_tag = self.wizard._create_base_build_tag(temp_dir, project_name)
+                if base_build_tag:
+                    self._report(f"✅ Base build tag created: {base_build_tag}", flush=False)
                 else:
-                    self.progress_update.emit("⚠️ Private repository creation skipped (no GitHub token)")
+                    self._report("⚠️ Base build tag could not be created", flush=False)
                 
-                # Step 13: Create base build tag
-                self.progress_update.emit("🏷️ Creating base build tag...")
-                self.wizard._create_base_build_tag(temp_dir, project_name)
-                self.progress_update.emit("✅ Base build tag created")
+                # Step 13: Push main with the tag to the new private repository
+                self._report("🆕 Creating new private repository...")
+                new_repo_url = self.wizard._push_to_private_repository(temp_dir, private_repo.result())
+                private_repo = None
+                if new_repo_url:
+                    self._report(f"✅ Private repository created: {new_repo_url}", flush=False)
+                else:
+                    self._report("⚠️ Private repository not created (no GitHub token or push failed)", flush=False)
                 
                 # Step 14: Move to final location
-                self.progress_update.emit("📦 Moving project to final location...")
-                final_project_dir = Path('projects') / project_name
-                
-                # Ensure projects directory exists
-                projects_dir = Path('projects')
-                projects_dir.mkdir(exist_ok=True)
-                
-                # Remove existing project directory if it exists
-                if final_project_dir.exists():
-                    import shutil
-                    shutil.rmtree(final_project_dir)
+                self._report("📦 Moving project to final location...")
+                final_project_dir = PROJECTS_DIR / project_name
                 
-                # Verify temp directory still exists before moving
-                if not temp_dir.exists():
-                    raise Exception(f"Temporary directory {temp_dir} was deleted unexpectedly")
-                
-                # Move the project
-                temp_dir.rename(final_project_dir)
-                self.progress_update.emit(f"✅ Project moved to: {final_project_dir}")
+                # Move the project; works across filesystems, unlike Path.rename
+                self.wizard._move_project(temp_dir, final_project_dir)
+                self._report(f"✅ Project moved to: {final_project_dir}", flush=False)
                 
                 # Success!
-                self.progress_update.emit("🎉 Project creation completed successfully!")
+                self._report("🎉 Project creation completed successfully!")
                 
                 result = {
                     'success': True,
@@ -1440,7 +1586,7 @@ class CreateProjectThread(QThread):
                     'firebase_project_id': firebase_project_id,
                     'github_url': github_url,
                     'new_repo_url': new_repo_url,
-                    'base_build_tag': f'base-build-{datetime.now().strftime("%Y-%m-%d")}',
+                    'base_build_tag': base_build_tag,
                     'message': f'Project {project_name} created successfully!'
                 }
                 
@@ -1449,44 +1595,93 @@ class CreateProjectThread(QThread):
             except Exception as e:
                 # Clean up temp directory on error
                 if temp_dir.exists():
-                    import shutil
-                    shutil.rmtree(temp_dir)
-                self.progress_update.emit(f"❌ Error during project creation: {str(e)}")
+                    _rmtree(temp_dir)
+                if private_repo is not None:
+                    self.wizard._delete_github_repository(private_repo)
+                self._report(f"❌ Error during project creation: {str(e)}")
                 self.result_ready.emit({"success": False, "error": str(e)})
                 return
                 
         except Exception as e:
-            self.progress_update.emit(f"💥 Project creation failed: {str(e)}")
+            self._report(f"💥 Project creation failed: {str(e)}")
             self.result_ready.emit({"success": False, "error": str(e)})
 
 class FlaskWizard:
     """Flask-based web interface for the project wizard"""
     
     def __init__(self):
+        from flask import Flask
         self.wizard = ProjectWizard()
         self.app = Flask(__name__)
+        # Templates ship with the app, so compile index.html once and skip mtime checks
+        self.app.config['TEMPLATES_AUTO_RELOAD'] = False
+        self.app.jinja_env.auto_reload = False
+        self.index_template = self.app.jinja_env.get_template('index.html')
+        self._index_html = None
+        # Project creation takes minutes, so it runs off the request thread as a polled job;
+        # job_id -> (submitted_at, future)
+        self.jobs: Dict[str, Tuple[float, Future]] = {}
+        self.job_executor = ThreadPoolExecutor(max_workers=4)
         self.setup_routes()
     
     def setup_routes(self):
         """Setup Flask routes"""
+        from flask import request, jsonify
         
         @self.app.route('/')
         def index():
-            return render_template('index.html', templates=self.wizard.get_templates())
+            # The page only depends on the configured templates, which don't change while running
+            if self._index_html is None:
+                self._index_html = self.index_template.render(templates=self.wizard.get_templates())
+            return self._index_html
         
         @self.app.route('/api/create_project', methods=['POST'])
         def create_project():
-            data = request.json
-            result = self.wizard.create_project(data)
-            return jsonify(result)
+            data = request.get_json(silent=True)
+            if not isinstance(data, dict):
+                return jsonify({'success': False, 'error': 'Expected a JSON object'}), 400
+            # Reject bad input now rather than from a job the client has to poll for
+            error = self.wizard._preflight(data.get('name', ''), data.get('org_domain', ''),
+                                           data.get('template_repo', ''), data.get('template_branch', 'main'))
+            if error:
+                return jsonify({'success': False, 'error': error}), 400
+            
+            self._prune_jobs()
+            job_id = secrets.token_hex(8)
+            self.jobs[job_id] = (time.monotonic(), self.job_executor.submit(self.wizard.create_project, data))
+            return jsonify({'job_id': job_id}), 202
+        
+        @self.app.route('/api/jobs/<job_id>')
+        def get_job(job_id):
+            entry = self.jobs.get(job_id)
+            if entry is None:
+                return jsonify({'success': False, 'error': 'Unknown job'}), 404
+            job = entry[1]
+            if not job.done():
+                return jsonify({'status': 'running'})
+            self.jobs.pop(job_id, None)
+            try:
+                result = job.result()
+            except Exception as e:
+                result = {'success': False, 'error': str(e)}
+            return jsonify({'status': 'done', **result})
         
         @self.app.route('/api/templates')
         def get_templates():
             return jsonify(self.wizard.get_templates())
     
+    def _prune_jobs(self):
+        """Forget finished jobs whose results were not collected within JOB_RESULT_TTL"""
+        cutoff = time.monotonic() - JOB_RESULT_TTL
+        for job_id, (submitted_at, job) in list(self.jobs.items()):
+            if submitted_at < cutoff and job.done():
+                self.jobs.pop(job_id, None)
+    
     def run(self, port=5000):
         """Run the Flask application"""
-        self.app.run(debug=True, port=port)
+        # Threaded so page loads and job polls are served while projects are being created;
+        # no debug reloader, which re-imports the app and polls every source file
+        self.app.run(debug=False, threaded=True, port=port)
 
 def main():
     """Main entry point"""
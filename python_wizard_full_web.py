@@ -6,144 +6,191 @@ A comprehensive version that matches all features of the original PyQt6 app
 
 import sys
 import os
+import copy
+import errno
+import gzip
+import hashlib
 import json
 import subprocess
 import threading
 import webbrowser
+import random
 import re
+import shutil
 import time
+import uuid
 import http.server
-import socketserver
 import urllib.parse
-from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import requests
+from urllib3.util.retry import Retry
 
-class FullWebServer:
-    def __init__(self, port=9000):
-        self.port = port
-        self.server = None
-        self.thread = None
-        self.wizard = ProjectWizard()
-        
-    def start(self):
-        """Start the web server in a separate thread"""
+# Optional in-process git support
+try:
+    import pygit2
+    PYGIT2_AVAILABLE = True
+except ImportError:
+    PYGIT2_AVAILABLE = False
+
+from firebase_helpers import (
+    FIREBASE_BIN, FIREBASE_PLATFORMS, PLATFORM_LABELS,
+    create_firebase_apps, download_firebase_configs, retry_delay
+)
+from git_helpers import git_commit_all
+from json_helpers import json_bytes, json_dumps, json_loads, write_json
+
+# Environment for git network calls; with no usable credential helper they fail
+# straight away instead of sitting on a hidden prompt until the timeout
+GIT_ENV = dict(os.environ, GIT_TERMINAL_PROMPT='0')
+
+# Environment for Firebase CLI calls; skips the npm update check that
+# firebase-tools otherwise performs on every launch
+FIREBASE_CLI_ENV = dict(os.environ, NO_UPDATE_NOTIFIER='1')
+
+# Template identifiers rewritten for each new project; the bundle ID must come
+# first so it wins over the bare app name it contains
+TEMPLATE_IDENTIFIER_RE = re.compile(r'com\.meghzone\.mytemplate-app|mytemplate-app')
+# Contained in every template identifier, for a byte-level check before decoding
+TEMPLATE_IDENTIFIER_MARKER = b'mytemplate-app'
+
+# Template files rewritten for each new project, and the JSON ones among them
+# that also get a "firebase" section
+REPOSITORY_CONFIG_FILES = (
+    'pubspec.yaml',
+    'android/app/build.gradle',
+    'ios/Runner.xcodeproj/project.pbxproj',
+    'ios/Runner/Info.plist',
+    'web/index.html',
+    'README.md',
+    'firebase.json',
+    'firestore.rules',
+    'storage.rules',
+    'assets/config/app_config.json',
+    'assets/config/app_config_sample.json'
+)
+FIREBASE_JSON_CONFIG_FILES = frozenset({
+    'firebase.json',
+    'assets/config/app_config.json',
+    'assets/config/app_config_sample.json'
+})
+
+# "key: value" lines in non-JSON SDK config output; '#' lines are skipped and the
+# value loses surrounding whitespace and quotes
+CONFIG_LINE_RE = re.compile(r'^(?!#)[ \t\r]*([^:\n]*?)[ \t\r]*:[ \t\r]*[\'"]*(.*?)[\'"]*[ \t\r]*$', re.MULTILINE)
+
+# Static Firebase project files written into every new project, encoded once at import
+FIREBASE_JSON = json.dumps({
+    "firestore": {
+        "rules": "firestore.rules",
+        "indexes": "firestore.indexes.json"
+    },
+    "storage": {
+        "rules": "storage.rules"
+    },
+    "hosting": {
+        "public": "public",
+        "ignore": [
+            "firebase.json",
+            "**/.*",
+            "**/node_modules/**"
+        ]
+    }
+}, indent=2).encode('utf-8')
+FIRESTORE_RULES = """rules_version = '2';
+service cloud.firestore {
+  match /databases/{database}/documents {
+    match /{document=**} {
+      allow read, write: if request.auth != null;
+    }
+  }
+}""".encode('utf-8')
+STORAGE_RULES = """rules_version = '2';
+service firebase.storage {
+  match /b/{bucket}/o {
+    match /{allPaths=**} {
+      allow read, write: if request.auth != null;
+    }
+  }
+}""".encode('utf-8')
+FIRESTORE_INDEXES_JSON = json.dumps({
+    "indexes": [],
+    "fieldOverrides": []
+}, indent=2).encode('utf-8')
+
+# GitHub repository/branch listings as (url, token sha256) -> (expires_at, items)
+_GITHUB_LIST_CACHE: Dict[Tuple[str, str], Tuple[float, List[Dict[str, Any]]]] = {}
+_GITHUB_LIST_LOCK = threading.Lock()
+# Listings currently being fetched, so concurrent requests share one round-trip
+_GITHUB_LIST_IN_FLIGHT: Dict[Tuple[str, str], Future] = {}
+GITHUB_LIST_TTL = 60  # seconds
+
+# GitHub's largest page size, and how many further pages are fetched at once
+GITHUB_PER_PAGE = 100
+GITHUB_PAGE_WORKERS = 4
+
+# Transient GitHub gateway errors are retried after 0.5s, 1s, 2s; only idempotent
+# methods are retried, so a repository POST is never sent twice
+GITHUB_RETRY = Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504), raise_on_status=False)
+
+# Firebase projects whose setup has not finished yet, as "name:org_domain" -> {project_id, app_ids};
+# an entry is written as soon as the project exists and removed once its setup succeeds
+FIREBASE_STATE_FILE = Path.home() / '.newprojwiz' / 'firebase_projects.json'
+_FIREBASE_STATE_LOCK = threading.Lock()
+
+# Deletes discarded project directories off the request path
+_CLEANUP_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix='cleanup')
+# Long-running steps started ahead of the ones that need their result
+_WORK_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='wizard')
+
+@lru_cache(maxsize=128)
+def _load_json_cached(path_str: str, mtime_ns: int, size: int):
+    """Parse a JSON file once per (path, mtime, size); callers must not mutate the result"""
+    return json_loads(Path(path_str).read_bytes())
+
+def _load_json_file(path: Path):
+    """Return a private copy of a JSON file's parsed contents, reusing earlier parses"""
+    st = path.stat()
+    return copy.deepcopy(_load_json_cached(str(path), st.st_mtime_ns, st.st_size))
+
+def _discard_dir(path: Path):
+    """Move a directory out of the way at once and delete it in the background"""
+    trash = path.with_name(f".trash-{path.name}-{uuid.uuid4().hex}")
+    try:
+        path.rename(trash)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+        return
+    _CLEANUP_POOL.submit(shutil.rmtree, trash, ignore_errors=True)
+
+def _firebase_state_get(key: str) -> Optional[Dict[str, Any]]:
+    """Look up a recorded Firebase project; None if missing or unreadable"""
+    try:
+        return json_loads(FIREBASE_STATE_FILE.read_bytes()).get(key)
+    except (OSError, ValueError):
+        return None
+
+def _firebase_state_put(key: str, value: Optional[Dict[str, Any]]):
+    """Record a Firebase project, or forget it when value is None, replacing the state file atomically"""
+    with _FIREBASE_STATE_LOCK:
         try:
-            handler = self.create_handler()
-            self.server = socketserver.TCPServer(("", self.port), handler)
-            # Add wizard instance to server
-            self.server.wizard = self.wizard
-            self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
-            self.thread.start()
-            print(f"🌐 Web server started on http://localhost:{self.port}")
-            return True
-        except OSError as e:
-            if e.errno == 48:  # Address already in use
-                print(f"❌ Port {self.port} is already in use. Trying port {self.port + 1}...")
-                self.port += 1
-                return self.start()  # Try next port
-            else:
-                print(f"❌ Failed to start web server: {e}")
-                return False
-        except Exception as e:
-            print(f"❌ Failed to start web server: {e}")
-            return False
-    
-    def stop(self):
-        """Stop the web server"""
-        if self.server:
-            self.server.shutdown()
-            self.server.server_close()
-    
-    def create_handler(self):
-        """Create HTTP request handler"""
-        class RequestHandler(http.server.SimpleHTTPRequestHandler):
-            def do_GET(self):
-                if self.path == '/':
-                    self.send_response(200)
-                    self.send_header('Content-type', 'text/html')
-                    self.end_headers()
-                    self.wfile.write(self.get_main_page().encode())
-                elif self.path == '/api/templates':
-                    self.send_response(200)
-                    self.send_header('Content-type', 'application/json')
-                    self.end_headers()
-                    templates = self.server.wizard.get_templates()
-                    self.wfile.write(json.dumps(templates).encode())
-                elif self.path == '/api/repositories':
-                    self.send_response(200)
-                    self.send_header('Content-type', 'application/json')
-                    self.end_headers()
-                    repositories = self.server.wizard.get_github_repositories()
-                    self.wfile.write(json.dumps(repositories).encode())
-                elif self.path.startswith('/api/branches/'):
-                    repo_name = urllib.parse.unquote(self.path.split('/api/branches/')[1])
-                    self.send_response(200)
-                    self.send_header('Content-type', 'application/json')
-                    self.end_headers()
-                    branches = self.server.wizard.get_github_branches(repo_name)
-                    self.wfile.write(json.dumps(branches).encode())
-                elif self.path == '/api/config':
-                    self.send_response(200)
-                    self.send_header('Content-type', 'application/json')
-                    self.end_headers()
-                    config = self.server.wizard.config
-                    # Don't send the actual token for security
-                    safe_config = {k: v for k, v in config.items() if k != 'github_token'}
-                    safe_config['github_token'] = '***' if config.get('github_token') else ''
-                    self.wfile.write(json.dumps(safe_config).encode())
-                else:
-                    self.send_response(404)
-                    self.end_headers()
-            
-            def do_POST(self):
-                if self.path == '/api/create_project':
-                    content_length = int(self.headers['Content-Length'])
-                    post_data = self.rfile.read(content_length)
-                    project_data = json.loads(post_data.decode())
-                    
-                    # Create project using the wizard
-                    result = self.server.wizard.create_project(project_data)
-                    
-                    self.send_response(200)
-                    self.send_header('Content-type', 'application/json')
-                    self.end_headers()
-                    self.wfile.write(json.dumps(result).encode())
-                elif self.path == '/api/save_config':
-                    content_length = int(self.headers['Content-Length'])
-                    post_data = self.rfile.read(content_length)
-                    config_data = json.loads(post_data.decode())
-                    
-                    # Save configuration
-                    self.server.wizard.config.update(config_data)
-                    self.server.wizard.save_config()
-                    
-                    result = {"success": True, "message": "Settings saved successfully"}
-                    self.send_response(200)
-                    self.send_header('Content-type', 'application/json')
-                    self.end_headers()
-                    self.wfile.write(json.dumps(result).encode())
-                elif self.path == '/api/test_token':
-                    content_length = int(self.headers['Content-Length'])
-                    post_data = self.rfile.read(content_length)
-                    data = json.loads(post_data.decode())
-                    token = data.get('token', '')
-                    
-                    # Test GitHub token
-                    is_valid = self.server.wizard.validate_github_token(token)
-                    result = {"success": is_valid, "message": "Token is valid" if is_valid else "Token is invalid"}
-                    
-                    self.send_response(200)
-                    self.send_header('Content-type', 'application/json')
-                    self.end_headers()
-                    self.wfile.write(json.dumps(result).encode())
-                else:
-                    self.send_response(404)
-                    self.end_headers()
-            
-            def get_main_page(self):
-                return """
+            state = json_loads(FIREBASE_STATE_FILE.read_bytes())
+        except (OSError, ValueError):
+            state = {}
+        if value is None:
+            if state.pop(key, None) is None:
+                return
+        else:
+            state[key] = value
+        FIREBASE_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = FIREBASE_STATE_FILE.with_name(f"{FIREBASE_STATE_FILE.name}.{uuid.uuid4().hex}.tmp")
+        write_json(tmp, state)
+        os.replace(tmp, FIREBASE_STATE_FILE)
+
+# Single-page UI, encoded once at import
+MAIN_PAGE_HTML = """
 <!DOCTYPE html>
 <html>
 <head>
@@ -444,11 +491,12 @@ class FullWebServer:
             event.target.classList.add('active');
         }
         
-        // Load repositories on page load
-        window.onload = function() {
-            loadRepositories();
-            loadConfig();
-        };
+        // Branch lists requested ahead of the user picking a repository, keyed by full name
+        const branchPrefetch = {};
+        
+        function fetchBranches(repoName) {
+            return fetch('/api/branches/' + encodeURIComponent(repoName)).then(response => response.json());
+        }
         
         // Load GitHub repositories
         async function loadRepositories() {
@@ -465,6 +513,13 @@ class FullWebServer:
                     option.textContent = repo.full_name;
                     select.appendChild(option);
                 });
+                
+                // The first repository is the most likely pick, so start on its branches now
+                if (repositories.length > 0) {
+                    const first = repositories[0].full_name;
+                    branchPrefetch[first] = fetchBranches(first);
+                    branchPrefetch[first].catch(() => delete branchPrefetch[first]);
+                }
             } catch (error) {
                 console.error('Error loading repositories:', error);
             }
@@ -481,8 +536,9 @@ class FullWebServer:
             }
             
             try {
-                const response = await fetch('/api/branches/' + encodeURIComponent(repoName));
-                const branches = await response.json();
+                const prefetched = branchPrefetch[repoName];
+                delete branchPrefetch[repoName];
+                const branches = await (prefetched || fetchBranches(repoName));
                 
                 branchSelect.innerHTML = '<option value="">Select a branch...</option>';
                 branches.forEach(branch => {
@@ -510,6 +566,10 @@ class FullWebServer:
             }
         }
         
+        // The script runs after the markup, so both independent loads can start at once
+        // instead of waiting for window.onload
+        Promise.all([loadRepositories(), loadConfig()]);
+        
         // Test GitHub token
         async function testToken() {
             const token = document.getElementById('github_token').value;
@@ -644,7 +704,173 @@ class FullWebServer:
     </script>
 </body>
 </html>
-                """
+"""
+MAIN_PAGE_BYTES = MAIN_PAGE_HTML.encode('utf-8')
+MAIN_PAGE_LENGTH = str(len(MAIN_PAGE_BYTES))
+# Compressed once for every browser that accepts gzip; roughly a fifth of the size
+MAIN_PAGE_GZIP = gzip.compress(MAIN_PAGE_BYTES, compresslevel=9, mtime=0)
+MAIN_PAGE_GZIP_LENGTH = str(len(MAIN_PAGE_GZIP))
+
+# GET API responses are per-user and may change at any save, so browsers keep them but
+# revalidate each time; an unchanged body comes back as a bodiless 304
+API_CACHE_CONTROL = 'private, no-cache'
+
+# How many consecutive ports start() tries before giving up
+MAX_PORT_ATTEMPTS = 20
+
+# The only prefix route; the rest of the path is the URL-quoted repository name
+BRANCHES_ROUTE = '/api/branches/'
+
+class FullWebServer:
+    def __init__(self, port=9000):
+        self.port = port
+        self.server = None
+        self.thread = None
+        self.wizard = ProjectWizard()
+        
+    def start(self):
+        """Start the web server in a separate thread, moving up to a free port if needed"""
+        try:
+            handler = self.create_handler()
+            for _ in range(MAX_PORT_ATTEMPTS):
+                try:
+                    # A thread per request, so a slow GitHub or project call doesn't queue the page loads
+                    self.server = http.server.ThreadingHTTPServer(("", self.port), handler)
+                    break
+                except OSError as e:
+                    if e.errno != errno.EADDRINUSE:
+                        raise
+                    print(f"❌ Port {self.port} is already in use. Trying port {self.port + 1}...")
+                    self.port += 1
+            else:
+                print(f"❌ Failed to start web server: no free port after {MAX_PORT_ATTEMPTS} attempts")
+                return False
+            
+            # Add wizard instance to server
+            self.server.wizard = self.wizard
+            self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+            self.thread.start()
+            print(f"🌐 Web server started on http://localhost:{self.port}")
+            return True
+        except Exception as e:
+            print(f"❌ Failed to start web server: {e}")
+            return False
+    
+    def stop(self):
+        """Stop the web server"""
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+    
+    def create_handler(self):
+        """Create HTTP request handler"""
+        class RequestHandler(http.server.SimpleHTTPRequestHandler):
+            # Buffer the socket writer so the header block and the body go out in a
+            # single send when the handler finishes, instead of one send each
+            wbufsize = 64 * 1024
+            
+            def do_GET(self):
+                handler = self.GET_ROUTES.get(self.path)
+                if handler:
+                    handler(self)
+                elif self.path.startswith(BRANCHES_ROUTE):
+                    self.serve_branches()
+                else:
+                    self.send_response(404)
+                    self.end_headers()
+            
+            def do_POST(self):
+                handler = self.POST_ROUTES.get(self.path)
+                if handler is None:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                
+                content_length = int(self.headers['Content-Length'])
+                data = json_loads(self.rfile.read(content_length))
+                self.send_json(handler(self, data))
+            
+            def send_json(self, obj, status=200, etag=False):
+                """Write obj as a complete JSON response"""
+                self.send_json_bytes(json_bytes(obj), status, etag)
+            
+            def send_json_bytes(self, body, status=200, etag=False):
+                """Write already-serialised JSON as a complete response; with etag, an
+                unchanged body is answered with an empty 304"""
+                if etag:
+                    tag = f'"{hashlib.blake2s(body, digest_size=8).hexdigest()}"'
+                    if self.headers.get('If-None-Match') == tag:
+                        self.send_response(304)
+                        self.send_header('ETag', tag)
+                        self.send_header('Cache-Control', API_CACHE_CONTROL)
+                        self.end_headers()
+                        return
+                
+                self.send_response(status)
+                self.send_header('Content-type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                if etag:
+                    self.send_header('ETag', tag)
+                    self.send_header('Cache-Control', API_CACHE_CONTROL)
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def serve_main_page(self):
+                use_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+                self.send_response(200)
+                self.send_header('Content-type', 'text/html; charset=utf-8')
+                self.send_header('Vary', 'Accept-Encoding')
+                if use_gzip:
+                    self.send_header('Content-Encoding', 'gzip')
+                    self.send_header('Content-Length', MAIN_PAGE_GZIP_LENGTH)
+                else:
+                    self.send_header('Content-Length', MAIN_PAGE_LENGTH)
+                self.end_headers()
+                self.wfile.write(MAIN_PAGE_GZIP if use_gzip else MAIN_PAGE_BYTES)
+            
+            def serve_templates(self):
+                self.send_json_bytes(self.server.wizard.get_templates_json(), etag=True)
+            
+            def serve_repositories(self):
+                self.send_json(self.server.wizard.get_github_repositories(), etag=True)
+            
+            def serve_branches(self):
+                repo_name = self.path[len(BRANCHES_ROUTE):]
+                if '%' in repo_name:
+                    repo_name = urllib.parse.unquote(repo_name)
+                self.send_json(self.server.wizard.get_github_branches(repo_name), etag=True)
+            
+            def serve_config(self):
+                self.send_json_bytes(self.server.wizard.get_safe_config_json(), etag=True)
+            
+            def create_project(self, project_data):
+                # Create project using the wizard
+                return self.server.wizard.create_project(project_data)
+            
+            def save_config(self, config_data):
+                # Save configuration
+                with self.server.wizard.lock:
+                    self.server.wizard.config.update(config_data)
+                    self.server.wizard.save_config()
+                return {"success": True, "message": "Settings saved successfully"}
+            
+            def test_token(self, data):
+                # Test GitHub token
+                is_valid = self.server.wizard.validate_github_token(data.get('token', ''))
+                return {"success": is_valid, "message": "Token is valid" if is_valid else "Token is invalid"}
+            
+            # Exact-path routes; BRANCHES_ROUTE is matched by prefix in do_GET
+            GET_ROUTES = {
+                '/': serve_main_page,
+                '/api/templates': serve_templates,
+                '/api/repositories': serve_repositories,
+                '/api/config': serve_config,
+            }
+            POST_ROUTES = {
+                '/api/create_project': create_project,
+                '/api/save_config': save_config,
+                '/api/test_token': test_token,
+            }
         
         return RequestHandler
 
@@ -653,17 +879,34 @@ class ProjectWizard:
     
     def __init__(self):
         self.config = self.load_config()
-        self.step_updates = []
+        # Request handlers run on separate threads and share this wizard, so each
+        # request thread collects its own step updates
+        self._step_updates = threading.local()
+        self.lock = threading.Lock()
+        # Serialised /api/templates and /api/config bodies; cleared by save_config
+        self._response_cache: Dict[str, bytes] = {}
+        # GitHub logins already looked up, keyed by token sha256
+        self._github_usernames: Dict[str, str] = {}
+        # One keep-alive pool for every GitHub call instead of a new TLS connection each time
+        self.session = requests.Session()
+        self.session.mount('https://', requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                                                                    max_retries=GITHUB_RETRY))
+        self.session.headers.update({
+            'Accept': 'application/vnd.github.v3+json',
+            'User-Agent': 'Project-Wizard'
+        })
         
     def add_step_update(self, message: str):
-        """Add a step update message"""
-        self.step_updates.append(message)
+        """Add a step update message for the current request"""
+        if not hasattr(self._step_updates, 'updates'):
+            self._step_updates.updates = []
+        self._step_updates.updates.append(message)
         print(message)  # Also print to terminal
     
     def get_step_updates(self) -> List[str]:
-        """Get all step updates and clear the list"""
-        updates = self.step_updates.copy()
-        self.step_updates.clear()
+        """Get the current request's step updates and clear the list"""
+        updates = getattr(self._step_updates, 'updates', [])
+        self._step_updates.updates = []
         return updates
     
     def load_config(self) -> Dict[str, Any]:
@@ -671,8 +914,7 @@ class ProjectWizard:
         config_path = Path("config.json")
         if config_path.exists():
             try:
-                with open(config_path, 'r') as f:
-                    return json.load(f)
+                return json_loads(config_path.read_bytes())
             except Exception as e:
                 print(f"Error loading config: {e}")
         
@@ -690,9 +932,9 @@ class ProjectWizard:
     
     def save_config(self):
         """Save configuration to file"""
+        self._response_cache.clear()
         try:
-            with open("config.json", 'w') as f:
-                json.dump(self.config, f, indent=2)
+            write_json(Path("config.json"), self.config)
         except Exception as e:
             print(f"Error saving config: {e}")
     
@@ -700,11 +942,32 @@ class ProjectWizard:
         """Get available templates"""
         return self.config.get('templates', {})
     
+    def get_templates_json(self) -> bytes:
+        """get_templates() as JSON, serialised once per config change"""
+        return self._cached_response('templates', self.get_templates)
+    
+    def get_safe_config_json(self) -> bytes:
+        """The config as JSON with the GitHub token masked, serialised once per config change"""
+        def safe_config():
+            # Don't send the actual token for security
+            safe = {k: v for k, v in self.config.items() if k != 'github_token'}
+            safe['github_token'] = '***' if self.config.get('github_token') else ''
+            return safe
+        return self._cached_response('config', safe_config)
+    
+    def _cached_response(self, key: str, build) -> bytes:
+        """Serialise build() once and reuse the bytes until save_config runs"""
+        with self.lock:
+            body = self._response_cache.get(key)
+            if body is None:
+                body = self._response_cache[key] = json_bytes(build())
+        return body
+    
     def validate_github_token(self, token: str) -> bool:
         """Validate GitHub token"""
         try:
             headers = {'Authorization': f'token {token}'}
-            response = requests.get('https://api.github.com/user', headers=headers)
+            response = self.session.get('https://api.github.com/user', headers=headers, timeout=10)
             return response.status_code == 200
         except:
             return False
@@ -716,14 +979,7 @@ class ProjectWizard:
             if not token:
                 return []
             
-            headers = {'Authorization': f'token {token}'}
-            response = requests.get('https://api.github.com/user/repos', headers=headers)
-            
-            if response.status_code == 200:
-                repos = response.json()
-                return [{'full_name': repo['full_name'], 'name': repo['name']} for repo in repos]
-            else:
-                return []
+            return self._get_github_list('https://api.github.com/user/repos', token, ('full_name', 'name'))
         except:
             return []
     
@@ -734,20 +990,67 @@ class ProjectWizard:
             if not token:
                 return []
             
-            headers = {'Authorization': f'token {token}'}
-            response = requests.get(f'https://api.github.com/repos/{repo_name}/branches', headers=headers)
-            
-            if response.status_code == 200:
-                branches = response.json()
-                return [{'name': branch['name']} for branch in branches]
-            else:
-                return []
+            return self._get_github_list(f'https://api.github.com/repos/{repo_name}/branches', token, ('name',))
         except:
             return []
     
+    def _get_github_list(self, url: str, token: str, fields: Tuple[str, ...]) -> List[Dict[str, Any]]:
+        """Fetch a GitHub list endpoint keeping only the given fields; reused for GITHUB_LIST_TTL seconds"""
+        key = (url, hashlib.sha256(token.encode()).hexdigest())
+        with _GITHUB_LIST_LOCK:
+            cached = _GITHUB_LIST_CACHE.get(key)
+            if cached and time.monotonic() < cached[0]:
+                return cached[1]
+            # Concurrent misses for the same listing wait for the first one's request
+            in_flight = _GITHUB_LIST_IN_FLIGHT.get(key)
+            if in_flight is None:
+                future = _GITHUB_LIST_IN_FLIGHT[key] = Future()
+        if in_flight is not None:
+            return in_flight.result()
+        
+        try:
+            items = self._fetch_github_list(url, token, fields)
+            if items is not None:
+                with _GITHUB_LIST_LOCK:
+                    _GITHUB_LIST_CACHE[key] = (time.monotonic() + GITHUB_LIST_TTL, items)
+            future.set_result(items or [])
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _GITHUB_LIST_LOCK:
+                del _GITHUB_LIST_IN_FLIGHT[key]
+        return items or []
+    
+    def _fetch_github_list(self, url: str, token: str, fields: Tuple[str, ...]) -> Optional[List[Dict[str, Any]]]:
+        """Request every page of a GitHub list endpoint; None if GitHub refuses the first page"""
+        headers = {'Authorization': f'token {token}'}
+        
+        def fetch_page(page):
+            response = self.session.get(url, headers=headers, params={'per_page': GITHUB_PER_PAGE, 'page': page}, timeout=10)
+            response.raise_for_status()
+            return response
+        
+        response = self.session.get(url, headers=headers, params={'per_page': GITHUB_PER_PAGE}, timeout=10)
+        if response.status_code != 200:
+            return None
+        pages = [response]
+        
+        # The Link header names the last page, so the remaining pages can be requested together
+        last = response.links.get('last')
+        if last:
+            last_page = int(urllib.parse.parse_qs(urllib.parse.urlparse(last['url']).query)['page'][0])
+            with ThreadPoolExecutor(max_workers=GITHUB_PAGE_WORKERS) as executor:
+                pages.extend(executor.map(fetch_page, range(2, last_page + 1)))
+        
+        return [{field: item[field] for field in fields} for page in pages for item in json_loads(page.content)]
+    
     def create_project(self, project_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new project with full functionality"""
         try:
+            # Start this request's progress log afresh
+            self._step_updates.updates = []
+            
             # Extract all required fields
             project_name = project_data.get('name', '')
             org_domain = project_data.get('org_domain', '')
@@ -773,21 +1076,22 @@ class ProjectWizard:
             # Create project directory directly
             project_dir = projects_dir / project_name
             if project_dir.exists():
-                import shutil
-                shutil.rmtree(project_dir)
+                _discard_dir(project_dir)
+            
+            # Firebase project creation doesn't depend on the clone, so start it now
+            firebase_project_future = None
+            if setup_firebase:
+                firebase_project_future = _WORK_POOL.submit(self._get_or_create_firebase_project, project_name, org_domain, firebase_account)
             
             try:
                 # Clone template repository directly to project directory
                 self.add_step_update(f"Cloning template repository: {template_repo}")
-                result = subprocess.run(
-                    ["git", "clone", "-b", template_branch, f"https://github.com/{template_repo}", str(project_dir)],
-                    capture_output=True,
-                    text=True
-                )
-                
-                if result.returncode != 0:
-                    self.add_step_update(f"ERROR: Failed to clone template: {result.stderr}")
-                    return {"success": False, "error": f"Failed to clone template: {result.stderr}"}
+                clone_error = self._clone_template(template_repo, template_branch, project_dir)
+                if clone_error:
+                    self.add_step_update(f"ERROR: Failed to clone template: {clone_error}")
+                    if firebase_project_future is not None:
+                        self._report_unused_firebase_project(firebase_project_future)
+                    return {"success": False, "error": f"Failed to clone template: {clone_error}"}
                 
                 # Update project configuration
                 self.add_step_update("Updating project configuration...")
@@ -812,7 +1116,7 @@ class ProjectWizard:
                 firebase_result = None
                 if setup_firebase:
                     self.add_step_update(f"Setting up Firebase for {project_name}...")
-                    firebase_result = self.setup_firebase_simplified(project_dir, project_data)
+                    firebase_result = self.setup_firebase_simplified(project_dir, project_data, firebase_project_future)
                     if not firebase_result.get('success'):
                         self.add_step_update(f"ERROR: Firebase setup failed: {firebase_result.get('error')}")
                         # Don't fail the entire process for Firebase issues
@@ -836,13 +1140,56 @@ class ProjectWizard:
             except Exception as e:
                 # Clean up project directory on error
                 if project_dir.exists():
-                    import shutil
-                    shutil.rmtree(project_dir)
+                    _discard_dir(project_dir)
+                if firebase_project_future is not None:
+                    self._report_unused_firebase_project(firebase_project_future)
                 return {"success": False, "error": str(e)}
                 
         except Exception as e:
             return {"success": False, "error": str(e)}
     
+    def _report_unused_firebase_project(self, project_future: Future):
+        """Wait for an early Firebase project creation after a failed run and report the project it left"""
+        try:
+            project_id, _, _ = project_future.result()
+        except Exception as e:
+            self.add_step_update(f"WARNING: Firebase project creation also failed: {e}")
+            return
+        # _get_or_create_firebase_project has already recorded it for the next attempt
+        self.add_step_update(f"WARNING: Firebase project {project_id} is not set up yet; it will be reused on the next attempt")
+    
+    def _clone_template(self, template_repo: str, template_branch: str, project_dir: Path) -> Optional[str]:
+        """Clone the template branch into project_dir; return an error message or None"""
+        url = f"https://github.com/{template_repo}"
+        if PYGIT2_AVAILABLE:
+            # In-process libgit2 clone, no git subprocess; libgit2 ignores git credential
+            # helpers, so private templates authenticate with the configured token
+            github_token = self.config.get('github_token')
+            callbacks = None
+            if github_token and github_token != 'your_github_personal_access_token_here':
+                callbacks = pygit2.RemoteCallbacks(credentials=pygit2.UserPass(github_token, 'x-oauth-basic'))
+            try:
+                pygit2.clone_repository(url, str(project_dir), checkout_branch=template_branch, callbacks=callbacks)
+                return None
+            except Exception as e:
+                # Fall back to the git CLI and its credential helpers
+                print(f"pygit2 clone failed, retrying with git: {e}")
+                shutil.rmtree(project_dir, ignore_errors=True)
+        
+        # Full history is kept because it is pushed to the new repository, but only
+        # the template branch is fetched, without tags (only main is ever pushed)
+        try:
+            result = subprocess.run(
+                ["git", "clone", "--single-branch", "--no-tags", "-b", template_branch, url, str(project_dir)],
+                capture_output=True,
+                text=True,
+                timeout=300,
+                env=GIT_ENV
+            )
+        except subprocess.TimeoutExpired:
+            return "git clone timed out"
+        return result.stderr if result.returncode != 0 else None
+    
     def update_project_config(self, project_dir: Path, project_data: Dict[str, Any]):
         """Update project configuration files"""
         project_name = project_data.get('name', '')
@@ -852,65 +1199,91 @@ class ProjectWizard:
         package_json = project_dir / "package.json"
         if package_json.exists():
             try:
-                with open(package_json, 'r') as f:
-                    data = json.load(f)
+                data = _load_json_file(package_json)
                 
                 data['name'] = project_name
                 data['description'] = project_data.get('description', '')
                 
-                with open(package_json, 'w') as f:
-                    json.dump(data, f, indent=2)
+                write_json(package_json, data)
             except Exception as e:
                 print(f"Warning: Could not update package.json: {e}")
     
     def init_git_repository(self, project_dir: Path, project_name: str):
         """Initialize Git repository"""
         try:
-            # Check if this is already a Git repository
+            # Check if this is already a Git repository; either way commit only if something changed
             git_dir = project_dir / ".git"
             if git_dir.exists():
                 print(f"Git repository already exists in {project_dir}")
-                # Check if there are any changes to commit
-                result = subprocess.run(["git", "status", "--porcelain"], cwd=project_dir, capture_output=True, text=True)
-                if result.stdout.strip():
-                    # There are changes, commit them
-                    subprocess.run(["git", "add", "."], cwd=project_dir, check=True)
-                    subprocess.run(["git", "commit", "-m", f"Project setup for {project_name}"], cwd=project_dir, check=True)
+                if self._commit_all_changes(project_dir, f"Project setup for {project_name}"):
                     print(f"Committed changes for {project_name}")
                 else:
                     print(f"No changes to commit for {project_name}")
             else:
                 # Initialize new Git repository
-                subprocess.run(["git", "init"], cwd=project_dir, check=True)
-                subprocess.run(["git", "add", "."], cwd=project_dir, check=True)
-                subprocess.run(["git", "commit", "-m", f"Initial commit for {project_name}"], cwd=project_dir, check=True)
+                if PYGIT2_AVAILABLE:
+                    pygit2.init_repository(str(project_dir))
+                else:
+                    subprocess.run(["git", "init"], cwd=project_dir, check=True)
+                self._commit_all_changes(project_dir, f"Initial commit for {project_name}")
                 print(f"Initialized new Git repository for {project_name}")
         except Exception as e:
             print(f"Warning: Could not initialize Git repository: {e}")
             # Don't fail the entire process for Git issues
     
-    def setup_firebase_simplified(self, project_dir: Path, project_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _commit_all_changes(self, project_dir: Path, message: str) -> bool:
+        """Stage and commit every change, in-process when pygit2 is available; False if nothing changed"""
+        if PYGIT2_AVAILABLE:
+            return git_commit_all(project_dir, message) is not None
+        # Commit straight after staging; only a failed commit needs checking for an empty index
+        subprocess.run(["git", "add", "-A"], cwd=project_dir, check=True)
+        result = subprocess.run(["git", "commit", "-q", "-m", message], cwd=project_dir, capture_output=True, text=True)
+        if result.returncode == 0:
+            return True
+        if subprocess.run(["git", "diff", "--cached", "--quiet"], cwd=project_dir).returncode == 0:
+            return False
+        raise subprocess.CalledProcessError(result.returncode, result.args, result.stdout, result.stderr)
+    
+    def setup_firebase_simplified(self, project_dir: Path, project_data: Dict[str, Any],
+                                  project_id_future: Optional[Future] = None) -> Dict[str, Any]:
         """Setup Firebase project (simplified version without Firestore database)"""
         try:
             project_name = project_data.get('name', '')
             org_domain = project_data.get('org_domain', '')
             firebase_account = project_data.get('firebase_account', '')
             
+            state_key = f"{project_name}:{org_domain}"
+            
             self.add_step_update(f"Setting up Firebase project: {project_name}")
             
             # Step 1: Create Firebase project
             self.add_step_update("Step 1: Creating Firebase project...")
-            project_id = self._create_firebase_project(project_name, firebase_account)
-            self.add_step_update(f"SUCCESS: Firebase project created: {project_id}")
-            
-            # Step 2: Create Firebase apps (iOS, Android, Web)
-            self.add_step_update("Step 2: Creating Firebase apps...")
-            app_ids = self._create_firebase_apps(project_id, project_name, org_domain, firebase_account)
+            if project_id_future is not None:
+                project_id, app_ids, reused = project_id_future.result()
+            else:
+                project_id, app_ids, reused = self._get_or_create_firebase_project(project_name, org_domain, firebase_account)
+            if reused:
+                self.add_step_update(f"SUCCESS: Reusing Firebase project from an earlier run: {project_id}")
+            else:
+                self.add_step_update(f"SUCCESS: Firebase project created: {project_id}")
+            
+            # A previous run may already have created some of this project's apps
+            app_ids = {platform: (app_ids or {}).get(platform, 'unknown') for platform in FIREBASE_PLATFORMS}
+            missing = tuple(platform for platform in FIREBASE_PLATFORMS if app_ids[platform] == 'unknown')
+            if len(missing) < len(FIREBASE_PLATFORMS):
+                # Existing apps only need their configs
+                self.add_step_update("Step 2: Reusing existing Firebase apps...")
+                self.add_step_update("Step 3: Downloading Firebase configurations...")
+                self._download_firebase_configs(project_dir, project_id, app_ids, firebase_account)
+            if missing:
+                # Steps 2-3: Create the missing Firebase apps, downloading each config as its app is ready
+                self.add_step_update("Step 2: Creating Firebase apps...")
+                self.add_step_update("Step 3: Downloading Firebase configurations...")
+                app_ids.update(self._create_firebase_apps(project_id, project_name, org_domain, firebase_account,
+                                                          project_dir, platforms=missing))
+                # Apps that failed stay 'unknown' so a retry creates only those
+                _firebase_state_put(state_key, {"project_id": project_id, "app_ids": app_ids})
             self.add_step_update(f"SUCCESS: Firebase apps created: {app_ids}")
-            
-            # Step 3: Download Firebase configurations
-            self.add_step_update("Step 3: Downloading Firebase configurations...")
-            self._download_firebase_configs(project_dir, project_id, app_ids, firebase_account)
             self.add_step_update("SUCCESS: Firebase configurations downloaded")
             
             # Step 4: Update config.json file with Firebase project and app data
@@ -920,9 +1293,14 @@ class ProjectWizard:
             
             # Step 5: Commit changes to repository
             self.add_step_update("Step 5: Committing changes to repository...")
-            self._commit_firebase_changes(project_dir, project_name)
+            self._commit_and_push_changes(project_dir, project_name)
             self.add_step_update("SUCCESS: Changes committed to repository")
             
+            # Fully set up, so a later run with the same name starts afresh; a missing app
+            # keeps the entry so the next attempt can fill it in
+            if 'unknown' not in app_ids.values():
+                _firebase_state_put(state_key, None)
+            
             return {
                 "success": True,
                 "project_id": project_id,
@@ -947,14 +1325,14 @@ class ProjectWizard:
             project_id = self._create_firebase_project(project_name, firebase_account)
             print(f"✅ Firebase project created: {project_id}")
             
-            # Step 2: Create Firebase apps (iOS, Android, Web)
-            print("Step 2: Creating Firebase apps...")
-            app_ids = self._create_firebase_apps(project_id, project_name, org_domain, firebase_account)
-            print(f"✅ Firebase apps created: {app_ids}")
+            # Firestore only needs the project, so provision it while the apps are created
+            firestore_future = _WORK_POOL.submit(self._setup_firestore_database, project_id, project_name, firebase_account)
             
-            # Step 3: Download Firebase configurations
+            # Steps 2-3: Create Firebase apps (iOS, Android, Web), downloading each config as its app is ready
+            print("Step 2: Creating Firebase apps...")
             print("Step 3: Downloading Firebase configurations...")
-            self._download_firebase_configs(project_dir, project_id, app_ids, firebase_account)
+            app_ids = self._create_firebase_apps(project_id, project_name, org_domain, firebase_account, project_dir)
+            print(f"✅ Firebase apps created: {app_ids}")
             print("✅ Firebase configurations downloaded")
             
             # Step 4: Update app configuration files
@@ -964,7 +1342,7 @@ class ProjectWizard:
             
             # Step 5: Setup Firestore database
             print("Step 5: Setting up Firestore database...")
-            self._setup_firestore_database(project_id, project_name, firebase_account)
+            firestore_future.result()
             print("✅ Firestore database setup completed")
             
             # Step 6: Update cloned repository config files
@@ -990,63 +1368,14 @@ class ProjectWizard:
     def _create_firebase_config_files(self, project_dir: Path, project_name: str, org_domain: str):
         """Create Firebase configuration files"""
         try:
-            # Create firebase.json
-            firebase_config = {
-                "firestore": {
-                    "rules": "firestore.rules",
-                    "indexes": "firestore.indexes.json"
-                },
-                "storage": {
-                    "rules": "storage.rules"
-                },
-                "hosting": {
-                    "public": "public",
-                    "ignore": [
-                        "firebase.json",
-                        "**/.*",
-                        "**/node_modules/**"
-                    ]
-                }
-            }
-            
-            firebase_json = project_dir / "firebase.json"
-            with open(firebase_json, 'w') as f:
-                json.dump(firebase_config, f, indent=2)
-            
-            # Create firestore.rules
-            firestore_rules = project_dir / "firestore.rules"
-            if not firestore_rules.exists():
-                with open(firestore_rules, 'w') as f:
-                    f.write("""rules_version = '2';
-service cloud.firestore {
-  match /databases/{database}/documents {
-    match /{document=**} {
-      allow read, write: if request.auth != null;
-    }
-  }
-}""")
-            
-            # Create storage.rules
-            storage_rules = project_dir / "storage.rules"
-            if not storage_rules.exists():
-                with open(storage_rules, 'w') as f:
-                    f.write("""rules_version = '2';
-service firebase.storage {
-  match /b/{bucket}/o {
-    match /{allPaths=**} {
-      allow read, write: if request.auth != null;
-    }
-  }
-}""")
-            
-            # Create firestore.indexes.json
-            firestore_indexes = project_dir / "firestore.indexes.json"
-            if not firestore_indexes.exists():
-                with open(firestore_indexes, 'w') as f:
-                    json.dump({
-                        "indexes": [],
-                        "fieldOverrides": []
-                    }, f, indent=2)
+            # firebase.json is always rewritten; the rules and indexes keep any existing copy
+            (project_dir / "firebase.json").write_bytes(FIREBASE_JSON)
+            for filename, content in (("firestore.rules", FIRESTORE_RULES),
+                                      ("storage.rules", STORAGE_RULES),
+                                      ("firestore.indexes.json", FIRESTORE_INDEXES_JSON)):
+                path = project_dir / filename
+                if not path.exists():
+                    path.write_bytes(content)
             
             print(f"Firebase configuration files created for {project_name}")
             
@@ -1054,10 +1383,37 @@ service firebase.storage {
             print(f"Warning: Could not create Firebase config files: {e}")
             # Don't fail the entire process for Firebase config issues
     
+    def _run_firebase(self, firebase_account: str, *args, **kwargs):
+        """Run a Firebase CLI command as the given account"""
+        return subprocess.run([FIREBASE_BIN, '--account', firebase_account, *args], env=FIREBASE_CLI_ENV, **kwargs)
+    
+    def _get_or_create_firebase_project(self, project_name: str, org_domain: str,
+                                        firebase_account: str) -> Tuple[str, Optional[Dict[str, str]], bool]:
+        """Reuse the Firebase project recorded for this name and domain if it still exists,
+        otherwise create one; returns (project_id, recorded app_ids or None, reused)"""
+        recorded = _firebase_state_get(f"{project_name}:{org_domain}")
+        if recorded and self._firebase_project_exists(recorded['project_id'], firebase_account):
+            print(f"♻️ Reusing Firebase project from an earlier run: {recorded['project_id']}")
+            return recorded['project_id'], recorded.get('app_ids'), True
+        project_id = self._create_firebase_project(project_name, firebase_account)
+        # Record the project straight away so a failure anywhere later can't leak it
+        _firebase_state_put(f"{project_name}:{org_domain}", {"project_id": project_id, "app_ids": None})
+        return project_id, None, False
+    
+    def _firebase_project_exists(self, project_id: str, firebase_account: str) -> bool:
+        """Check that the account can still open a Firebase project; costs one extra
+        CLI launch, scoped to that project, whenever a recorded project is found"""
+        try:
+            self._run_firebase(firebase_account, 'apps:list', '--project', project_id, '--json',
+                               check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=60)
+            return True
+        except subprocess.SubprocessError as e:
+            print(f"⚠️ Recorded Firebase project {project_id} is not available: {e}")
+            return False
+    
     def _create_firebase_project(self, project_name: str, firebase_account: str) -> str:
         """Create Firebase project"""
         try:
-            import random
             project_id = f'{project_name}-{random.randint(100000, 999999)}'
             display_name = project_name if len(project_name) >= 4 else f'{project_name}-project'
             
@@ -1071,219 +1427,41 @@ service firebase.storage {
                 
                 try:
                     print(f"Attempt {attempt}: Creating project {current_project_id}")
-                    result = subprocess.run([
-                        'firebase', '--account', firebase_account,
+                    self._run_firebase(
+                        firebase_account,
                         'projects:create', current_project_id,
-                        '--display-name', display_name
-                    ], check=True, capture_output=True, text=True, timeout=120)
+                        '--display-name', display_name,
+                        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=120)
                     
-                    print(f"Firebase project created successfully: {result.stdout}")
+                    print(f"Firebase project created successfully: {current_project_id}")
                     return current_project_id
                 except subprocess.CalledProcessError as e:
                     print(f"Attempt {attempt} failed: {e}")
                     print(f"Error output: {e.stderr}")
                     if attempt == 3:
                         raise Exception(f'Failed to create Firebase project after 3 attempts: {e.stderr}')
-                    time.sleep(2)
+                    time.sleep(retry_delay(attempt))
                 except subprocess.TimeoutExpired:
                     print(f"Attempt {attempt} timed out after 120 seconds")
                     if attempt == 3:
                         raise Exception('Firebase project creation timed out after 3 attempts')
-                    time.sleep(2)
+                    time.sleep(retry_delay(attempt))
             
             raise Exception('Unexpected error in Firebase project creation')
         except Exception as e:
             print(f"Firebase project creation failed: {e}")
             raise Exception(f'Firebase project creation failed: {e}')
     
-    def _create_firebase_apps(self, project_id: str, project_name: str, org_domain: str, firebase_account: str) -> Dict[str, str]:
-        """Create Firebase apps for iOS, Android, and Web"""
-        bundle_id = f'com.{org_domain}.{project_name}'
-        results = {'ios': 'unknown', 'android': 'unknown', 'web': 'unknown'}
-        
-        print(f"Creating Firebase apps for project: {project_id}")
-        print(f"Bundle ID: {bundle_id}")
-        print(f"Firebase account: {firebase_account}")
-        
-        # Create iOS app
-        try:
-            print(f"Creating iOS app: {project_name}-ios")
-            result = subprocess.run([
-                'firebase', '--account', firebase_account,
-                'apps:create', 'ios',
-                f'{project_name}-ios',
-                '--bundle-id', bundle_id,
-                '--project', project_id
-            ], check=True, capture_output=True, text=True, timeout=90, input='\n')
-            print(f"iOS app creation output: {result.stdout}")
-            results['ios'] = self._extract_app_id(result.stdout)
-            print(f"iOS app ID: {results['ios']}")
-        except subprocess.CalledProcessError as e:
-            print(f'Failed to create iOS app: {e}')
-            print(f'Error output: {e.stderr}')
-            print('Continuing without iOS app...')
-        except subprocess.TimeoutExpired:
-            print('iOS app creation timed out after 90 seconds')
-            print('Continuing without iOS app...')
-        except Exception as e:
-            print(f'Unexpected error creating iOS app: {e}')
-            print('Continuing without iOS app...')
-        
-        # Create Android app
-        try:
-            print(f"Creating Android app: {project_name}-android")
-            result = subprocess.run([
-                'firebase', '--account', firebase_account,
-                'apps:create', 'android',
-                f'{project_name}-android',
-                '--package-name', bundle_id,
-                '--project', project_id
-            ], check=True, capture_output=True, text=True, timeout=60)
-            print(f"Android app creation output: {result.stdout}")
-            results['android'] = self._extract_app_id(result.stdout)
-            print(f"Android app ID: {results['android']}")
-        except subprocess.TimeoutExpired:
-            print('Android app creation timed out after 60 seconds')
-        except subprocess.CalledProcessError as e:
-            print(f'Failed to create Android app: {e}')
-            print(f'Error output: {e.stderr}')
-        except Exception as e:
-            print(f'Unexpected error creating Android app: {e}')
-        
-        # Create Web app
-        try:
-            print(f"Creating Web app: {project_name}-web")
-            result = subprocess.run([
-                'firebase', '--account', firebase_account,
-                'apps:create', 'web',
-                f'{project_name}-web',
-                '--project', project_id
-            ], check=True, capture_output=True, text=True, timeout=60)
-            print(f"Web app creation output: {result.stdout}")
-            results['web'] = self._extract_app_id(result.stdout)
-            print(f"Web app ID: {results['web']}")
-        except subprocess.TimeoutExpired:
-            print('Web app creation timed out after 60 seconds')
-        except subprocess.CalledProcessError as e:
-            print(f'Failed to create Web app: {e}')
-            print(f'Error output: {e.stderr}')
-        except Exception as e:
-            print(f'Unexpected error creating Web app: {e}')
-        
-        return results
-    
-    def _extract_app_id(self, output: str) -> str:
-        """Extract app ID from Firebase CLI output"""
-        print(f"Extracting app ID from output: {output}")
-        
-        # Look for the specific pattern we saw in the test output
-        patterns = [
-            r'App ID: ([0-9]+:[0-9]+:[a-z]+:[a-zA-Z0-9]+)',
-            r'App ID: ([a-zA-Z0-9-]+)',
-            r'([0-9]+:[0-9]+:[a-z]+:[a-zA-Z0-9]+)',
-            r'([a-zA-Z0-9-]{20,})',
-            r'Created app ([a-zA-Z0-9-]+)',
-            r'App created: ([a-zA-Z0-9-]+)',
-            r'App ID ([0-9]+:[0-9]+:[a-z]+:[a-zA-Z0-9]+)',
-            r'App ID ([a-zA-Z0-9-]+)',
-            r'([0-9]+:[0-9]+:[a-z]+:[a-zA-Z0-9]+)',
-            r'([a-zA-Z0-9-]{15,})'
-        ]
-        
-        for i, pattern in enumerate(patterns):
-            match = re.search(pattern, output, re.IGNORECASE)
-            if match and match.group(1):
-                app_id = match.group(1)
-                print(f"Found app ID with pattern {i}: {app_id}")
-                return app_id
-        
-        # Try to extract any long alphanumeric string that looks like an app ID
-        words = output.split()
-        for word in words:
-            if len(word) > 15 and re.match(r'^[a-zA-Z0-9-:]+$', word):
-                print(f"Found potential app ID in word: {word}")
-                return word
-        
-        print("No app ID found in output")
-        return 'unknown'
+    def _create_firebase_apps(self, project_id: str, project_name: str, org_domain: str, firebase_account: str,
+                              project_dir: Optional[Path] = None, platforms=FIREBASE_PLATFORMS) -> Dict[str, str]:
+        """Create Firebase apps for the given platforms (iOS, Android, and Web by default); with
+        project_dir, each app's SDK config is downloaded as soon as that app exists"""
+        return create_firebase_apps(self._run_firebase, project_id, project_name, org_domain, firebase_account,
+                                    project_dir=project_dir, platforms=platforms)
     
     def _download_firebase_configs(self, project_dir: Path, project_id: str, app_ids: Dict[str, str], firebase_account: str):
         """Download Firebase configuration files"""
-        configs = {}
-        
-        print(f"Downloading Firebase configs for project: {project_id}")
-        print(f"App IDs: {app_ids}")
-        
-        # Download iOS config
-        if app_ids['ios'] and app_ids['ios'] != 'unknown':
-            try:
-                print(f"Downloading iOS config for app ID: {app_ids['ios']}")
-                result = subprocess.run([
-                    'firebase', '--account', firebase_account,
-                    'apps:sdkconfig', 'ios', app_ids['ios'], '--project', project_id
-                ], check=True, capture_output=True, text=True, timeout=30)
-                configs['ios'] = result.stdout
-                
-                # Save to ios/Runner/GoogleService-Info.plist
-                ios_dir = project_dir / 'ios' / 'Runner'
-                ios_dir.mkdir(parents=True, exist_ok=True)
-                with open(ios_dir / 'GoogleService-Info.plist', 'w') as f:
-                    f.write(result.stdout)
-                print("✅ iOS config downloaded successfully")
-            except subprocess.CalledProcessError as e:
-                print(f'Failed to download iOS config: {e}')
-            except subprocess.TimeoutExpired:
-                print('iOS config download timed out')
-        else:
-            print("⏭️ Skipping iOS config download (no valid app ID)")
-        
-        # Download Android config
-        if app_ids['android'] and app_ids['android'] != 'unknown':
-            try:
-                print(f"Downloading Android config for app ID: {app_ids['android']}")
-                result = subprocess.run([
-                    'firebase', '--account', firebase_account,
-                    'apps:sdkconfig', 'android', app_ids['android'], '--project', project_id
-                ], check=True, capture_output=True, text=True, timeout=30)
-                configs['android'] = result.stdout
-                
-                # Save to android/app/google-services.json
-                android_dir = project_dir / 'android' / 'app'
-                android_dir.mkdir(parents=True, exist_ok=True)
-                with open(android_dir / 'google-services.json', 'w') as f:
-                    f.write(result.stdout)
-                print("✅ Android config downloaded successfully")
-            except subprocess.CalledProcessError as e:
-                print(f'Failed to download Android config: {e}')
-            except subprocess.TimeoutExpired:
-                print('Android config download timed out')
-        else:
-            print("⏭️ Skipping Android config download (no valid app ID)")
-        
-        # Download Web config
-        if app_ids['web'] and app_ids['web'] != 'unknown':
-            try:
-                print(f"Downloading Web config for app ID: {app_ids['web']}")
-                result = subprocess.run([
-                    'firebase', '--account', firebase_account,
-                    'apps:sdkconfig', 'web', app_ids['web'], '--project', project_id
-                ], check=True, capture_output=True, text=True, timeout=30)
-                configs['web'] = result.stdout
-                
-                # Save to web/firebase-config.js
-                web_dir = project_dir / 'web'
-                web_dir.mkdir(exist_ok=True)
-                with open(web_dir / 'firebase-config.js', 'w') as f:
-                    f.write(result.stdout)
-                print("✅ Web config downloaded successfully")
-            except subprocess.CalledProcessError as e:
-                print(f'Failed to download Web config: {e}')
-            except subprocess.TimeoutExpired:
-                print('Web config download timed out')
-        else:
-            print("⏭️ Skipping Web config download (no valid app ID)")
-        
-        return configs
+        return download_firebase_configs(self._run_firebase, project_dir, project_id, app_ids, firebase_account)
     
     def _update_app_config_json(self, project_dir: Path, project_id: str, project_name: str, org_domain: str, app_ids: Dict[str, str]):
         """Update app configuration files with Firebase project details"""
@@ -1291,8 +1469,7 @@ service firebase.storage {
             # Update app_config.json if it exists
             app_config_file = project_dir / 'assets' / 'config' / 'app_config.json'
             if app_config_file.exists():
-                with open(app_config_file, 'r') as f:
-                    config = json.load(f)
+                config = _load_json_file(app_config_file)
                 
                 # Update Firebase configuration
                 config['firebase'] = {
@@ -1302,8 +1479,7 @@ service firebase.storage {
                     'project_name': project_name
                 }
                 
-                with open(app_config_file, 'w') as f:
-                    json.dump(config, f, indent=2)
+                write_json(app_config_file, config)
                 
                 print(f"✅ Updated app_config.json with Firebase details")
             else:
@@ -1320,23 +1496,24 @@ service firebase.storage {
             # Try to create Firestore database with asia-south1 region (Mumbai)
             # Note: Firebase CLI may not support --region flag, so we'll try without it
             try:
-                result = subprocess.run([
-                    'firebase', '--account', firebase_account,
+                # Only stderr is read (on failure), so stdout is not piped back
+                self._run_firebase(
+                    firebase_account,
                     'firestore:databases:create', '(default)',
                     '--project', project_id,
-                    '--region', 'asia-south1'
-                ], check=True, capture_output=True, text=True, timeout=60)
-                print(f"✅ Firestore database created: {result.stdout}")
+                    '--region', 'asia-south1',
+                    check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=60)
+                print(f"✅ Firestore database created for {project_id}")
             except subprocess.CalledProcessError as e:
                 if 'unknown option' in e.stderr or '--region' in e.stderr:
                     # Try without region flag (uses default region)
                     print("⚠️ Region flag not supported, trying with default region...")
-                    result = subprocess.run([
-                        'firebase', '--account', firebase_account,
+                    self._run_firebase(
+                        firebase_account,
                         'firestore:databases:create', '(default)',
-                        '--project', project_id
-                    ], check=True, capture_output=True, text=True, timeout=60)
-                    print(f"✅ Firestore database created with default region: {result.stdout}")
+                        '--project', project_id,
+                        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=60)
+                    print(f"✅ Firestore database created with default region for {project_id}")
                 else:
                     raise e
             
@@ -1356,58 +1533,54 @@ service firebase.storage {
         try:
             print(f"Updating repository config files for project: {project_name}")
             
+            replacements = {
+                'com.meghzone.mytemplate-app': f'com.{org_domain}.{project_name}',
+                'mytemplate-app': project_name
+            }
+            
             # Update various configuration files that might exist in the cloned repository
-            config_files = [
-                'pubspec.yaml',
-                'android/app/build.gradle',
-                'ios/Runner.xcodeproj/project.pbxproj',
-                'ios/Runner/Info.plist',
-                'web/index.html',
-                'README.md',
-                'firebase.json',
-                'firestore.rules',
-                'storage.rules',
-                'assets/config/app_config.json',
-                'assets/config/app_config_sample.json'
-            ]
-            
-            for config_file in config_files:
+            for config_file in REPOSITORY_CONFIG_FILES:
                 file_path = project_dir / config_file
-                if file_path.exists():
-                    try:
-                        with open(file_path, 'r') as f:
-                            content = f.read()
-                        
-                        # Replace old project identifiers with new ones
-                        content = content.replace('mytemplate-app', project_name)
-                        content = content.replace('com.meghzone.mytemplate-app', f'com.{org_domain}.{project_name}')
-                        
-                        # Add Firebase project ID if not present
-                        if 'firebase' in config_file.lower() or 'config' in config_file.lower():
-                            if project_id not in content:
-                                # Add Firebase configuration if it's a config file
-                                if config_file.endswith('.json'):
-                                    try:
-                                        config_data = json.loads(content)
-                                        config_data['firebase'] = {
-                                            'project_id': project_id,
-                                            'app_ids': app_ids,
-                                            'org_domain': org_domain,
-                                            'project_name': project_name
-                                        }
-                                        content = json.dumps(config_data, indent=2)
-                                    except json.JSONDecodeError:
-                                        # Not a valid JSON file, skip JSON updates
-                                        pass
-                        
-                        with open(file_path, 'w') as f:
-                            f.write(content)
-                        
-                        print(f"✅ Updated {config_file}")
-                    except Exception as e:
-                        print(f"⚠️ Warning: Could not update {config_file}: {e}")
-                else:
+                try:
+                    raw = file_path.read_bytes()
+                except FileNotFoundError:
                     print(f"⏭️ Skipping {config_file} (file not found)")
+                    continue
+                
+                # Files with no template identifier that don't take a Firebase section are
+                # left alone without decoding them (project.pbxproj can be hundreds of KB)
+                if TEMPLATE_IDENTIFIER_MARKER not in raw and config_file not in FIREBASE_JSON_CONFIG_FILES:
+                    print(f"⏭️ Skipping {config_file} (no changes)")
+                    continue
+                
+                try:
+                    original = raw.decode('utf-8')
+                    # Replace old project identifiers in a single pass
+                    content = TEMPLATE_IDENTIFIER_RE.sub(lambda match: replacements[match.group(0)], original)
+                    
+                    # Add Firebase project ID to the JSON config files if not present
+                    if config_file in FIREBASE_JSON_CONFIG_FILES and project_id not in content:
+                        try:
+                            config_data = json_loads(content)
+                            config_data['firebase'] = {
+                                'project_id': project_id,
+                                'app_ids': app_ids,
+                                'org_domain': org_domain,
+                                'project_name': project_name
+                            }
+                            content = json_dumps(config_data)
+                        except json.JSONDecodeError:
+                            # Not a valid JSON file, skip JSON updates
+                            pass
+                    
+                    if content == original:
+                        print(f"⏭️ Skipping {config_file} (no changes)")
+                        continue
+                    
+                    file_path.write_text(content, encoding='utf-8')
+                    print(f"✅ Updated {config_file}")
+                except Exception as e:
+                    print(f"⚠️ Warning: Could not update {config_file}: {e}")
             
             # Create or update Firebase configuration files
             self._create_firebase_config_files(project_dir, project_name, org_domain)
@@ -1416,36 +1589,6 @@ service firebase.storage {
             print(f"Warning: Could not update repository configs: {e}")
             print("⚠️ Proceeding with remaining steps...")
     
-    def _commit_and_push_changes(self, project_dir: Path, project_name: str):
-        """Commit and push changes to remote repository"""
-        try:
-            print(f"Committing and pushing changes for project: {project_name}")
-            
-            # Check if there are any changes to commit
-            result = subprocess.run(["git", "status", "--porcelain"], cwd=project_dir, capture_output=True, text=True)
-            if result.stdout.strip():
-                # There are changes, commit them
-                subprocess.run(["git", "add", "."], cwd=project_dir, check=True)
-                subprocess.run(["git", "commit", "-m", f"Firebase setup and configuration for {project_name}"], cwd=project_dir, check=True)
-                print(f"✅ Committed changes for {project_name}")
-                
-                # Try to push to remote repository
-                try:
-                    subprocess.run(["git", "push"], cwd=project_dir, check=True, timeout=60)
-                    print(f"✅ Pushed changes to remote repository for {project_name}")
-                except subprocess.CalledProcessError as e:
-                    print(f"⚠️ Warning: Could not push to remote repository: {e}")
-                    print("⚠️ Changes are committed locally but not pushed")
-                except subprocess.TimeoutExpired:
-                    print("⚠️ Warning: Push operation timed out")
-                    print("⚠️ Changes are committed locally but not pushed")
-            else:
-                print(f"ℹ️ No changes to commit for {project_name}")
-                
-        except Exception as e:
-            print(f"Warning: Could not commit and push changes: {e}")
-            print("⚠️ Proceeding with remaining steps...")
-    
     def _update_config_json_with_firebase(self, project_dir: Path, project_id: str, project_name: str, org_domain: str, app_ids: Dict[str, str], firebase_account: str):
         """Update app_config.json file with Firebase project and app data"""
         try:
@@ -1454,8 +1597,7 @@ service firebase.storage {
             
             if app_config_file.exists():
                 try:
-                    with open(app_config_file, 'r') as f:
-                        config_data = json.load(f)
+                    config_data = _load_json_file(app_config_file)
                 except json.JSONDecodeError:
                     # If file is not valid JSON, create new structure
                     config_data = {}
@@ -1501,8 +1643,7 @@ service firebase.storage {
                     'created_at': time.strftime('%Y-%m-%d %H:%M:%S')
                 }
                 
-                with open(app_config_file, 'w') as f:
-                    json.dump(config_data, f, indent=2)
+                write_json(app_config_file, config_data)
                 
                 print(f"SUCCESS: Updated {app_config_file} with Firebase configuration")
             else:
@@ -1518,50 +1659,16 @@ service firebase.storage {
         firebase_configs = {}
         
         try:
-            # Get web configuration
-            if app_ids.get('web') and app_ids['web'] != 'unknown':
-                try:
-                    result = subprocess.run([
-                        'firebase', '--account', firebase_account,
-                        'apps:sdkconfig', 'web', app_ids['web'], '--project', project_id
-                    ], check=True, capture_output=True, text=True, timeout=30)
-                    
-                    web_config = self._parse_firebase_config(result.stdout, 'web')
-                    if web_config:
-                        firebase_configs['web'] = web_config
-                        print(f"SUCCESS: Retrieved web Firebase configuration")
-                except Exception as e:
-                    print(f"WARNING: Could not get web Firebase config: {e}")
-            
-            # Get Android configuration
-            if app_ids.get('android') and app_ids['android'] != 'unknown':
-                try:
-                    result = subprocess.run([
-                        'firebase', '--account', firebase_account,
-                        'apps:sdkconfig', 'android', app_ids['android'], '--project', project_id
-                    ], check=True, capture_output=True, text=True, timeout=30)
-                    
-                    android_config = self._parse_firebase_config(result.stdout, 'android')
-                    if android_config:
-                        firebase_configs['android'] = android_config
-                        print(f"SUCCESS: Retrieved Android Firebase configuration")
-                except Exception as e:
-                    print(f"WARNING: Could not get Android Firebase config: {e}")
-            
-            # Get iOS configuration
-            if app_ids.get('ios') and app_ids['ios'] != 'unknown':
-                try:
-                    result = subprocess.run([
-                        'firebase', '--account', firebase_account,
-                        'apps:sdkconfig', 'ios', app_ids['ios'], '--project', project_id
-                    ], check=True, capture_output=True, text=True, timeout=30)
-                    
-                    ios_config = self._parse_firebase_config(result.stdout, 'ios')
-                    if ios_config:
-                        firebase_configs['ios'] = ios_config
-                        print(f"SUCCESS: Retrieved iOS Firebase configuration")
-                except Exception as e:
-                    print(f"WARNING: Could not get iOS Firebase config: {e}")
+            # The sdkconfig calls are independent, so fetch them concurrently;
+            # results keep the web, Android, iOS order used in app_config.json
+            platforms = [platform for platform in ('web', 'android', 'ios')
+                         if app_ids.get(platform) and app_ids[platform] != 'unknown']
+            if platforms:
+                with ThreadPoolExecutor(max_workers=len(platforms)) as executor:
+                    fetched = executor.map(
+                        lambda platform: self._fetch_sdkconfig(platform, app_ids[platform], project_id, firebase_account),
+                        platforms)
+                    firebase_configs = {platform: config for platform, config in fetched if config}
             
             # If no real configs were retrieved, create fallback configs
             if not firebase_configs:
@@ -1574,93 +1681,102 @@ service firebase.storage {
         
         return firebase_configs
     
+    def _fetch_sdkconfig(self, platform: str, app_id: str, project_id: str, firebase_account: str):
+        """Fetch and parse one app's SDK config; returns (platform, config or None)"""
+        label = PLATFORM_LABELS[platform]
+        try:
+            result = self._run_firebase(
+                firebase_account,
+                'apps:sdkconfig', platform, app_id, '--project', project_id,
+                check=True, capture_output=True, text=True, timeout=30)
+            
+            config = self._parse_firebase_config(result.stdout, platform)
+            if config:
+                print(f"SUCCESS: Retrieved {label} Firebase configuration")
+            return platform, config
+        except Exception as e:
+            print(f"WARNING: Could not get {label} Firebase config: {e}")
+            return platform, None
+    
     def _parse_firebase_config(self, config_output: str, platform: str) -> Dict[str, Any]:
         """Parse Firebase configuration output for a specific platform"""
         try:
             # Try to parse as JSON first
             if config_output.strip().startswith('{'):
-                config_data = json.loads(config_output)
+                config_data = json_loads(config_output)
                 return config_data
             else:
-                # If not JSON, try to extract key-value pairs
-                config = {}
-                lines = config_output.split('\n')
-                for line in lines:
-                    if ':' in line and not line.startswith('#'):
-                        key, value = line.split(':', 1)
-                        key = key.strip()
-                        value = value.strip().strip('"\'')
-                        if key and value:
-                            config[key] = value
-                return config
+                # If not JSON, extract key-value pairs in one scan
+                return {key: value for key, value in CONFIG_LINE_RE.findall(config_output) if key and value}
         except Exception as e:
             print(f"Warning: Could not parse {platform} Firebase config: {e}")
             return {}
     
     def _create_fallback_firebase_configs(self, project_id: str, app_ids: Dict[str, str], org_domain: str = None, project_name: str = None) -> Dict[str, Any]:
         """Create fallback Firebase configuration when real configs are not available"""
+        # Values shared by every platform, derived from the project ID once
+        api_key = f'AIzaSy{project_id[:8].upper()}'
+        sender_id = project_id.split('-')[-1] if '-' in project_id else '123456789'
+        storage_bucket = f'{project_id}.firebasestorage.app'
         return {
             'web': {
-                'apiKey': f'AIzaSy{project_id[:8].upper()}',
+                'apiKey': api_key,
                 'appId': app_ids.get('web', 'unknown'),
-                'messagingSenderId': project_id.split('-')[-1] if '-' in project_id else '123456789',
+                'messagingSenderId': sender_id,
                 'projectId': project_id,
                 'authDomain': f'{project_id}.firebaseapp.com',
-                'storageBucket': f'{project_id}.firebasestorage.app',
+                'storageBucket': storage_bucket,
                 'measurementId': f'G-{project_id[:8].upper()}'
             },
             'android': {
-                'apiKey': f'AIzaSy{project_id[:8].upper()}',
+                'apiKey': api_key,
                 'appId': app_ids.get('android', 'unknown'),
-                'messagingSenderId': project_id.split('-')[-1] if '-' in project_id else '123456789',
+                'messagingSenderId': sender_id,
                 'projectId': project_id,
-                'storageBucket': f'{project_id}.firebasestorage.app'
+                'storageBucket': storage_bucket
             },
             'ios': {
-                'apiKey': f'AIzaSy{project_id[:8].upper()}',
+                'apiKey': api_key,
                 'appId': app_ids.get('ios', 'unknown'),
-                'messagingSenderId': project_id.split('-')[-1] if '-' in project_id else '123456789',
+                'messagingSenderId': sender_id,
                 'projectId': project_id,
-                'storageBucket': f'{project_id}.firebasestorage.app',
+                'storageBucket': storage_bucket,
                 'iosBundleId': f'com.{org_domain}.{project_name}'
             }
         }
     
-    def _commit_firebase_changes(self, project_dir: Path, project_name: str):
+    def _commit_and_push_changes(self, project_dir: Path, project_name: str):
         """Commit Firebase-related changes to the repository and push to GitHub"""
         try:
-            print(f"Committing Firebase changes for project: {project_name}")
-            
-            # Check if there are any changes to commit
-            result = subprocess.run(["git", "status", "--porcelain"], cwd=project_dir, capture_output=True, text=True)
-            if result.stdout.strip():
-                # There are changes, commit them
-                subprocess.run(["git", "add", "."], cwd=project_dir, check=True)
-                subprocess.run(["git", "commit", "-m", f"Firebase setup and configuration for {project_name}"], cwd=project_dir, check=True)
-                print(f"✅ Committed Firebase changes for {project_name}")
+            print(f"Committing and pushing changes for project: {project_name}")
+            
+            if self._commit_all_changes(project_dir, f"Firebase setup and configuration for {project_name}"):
+                print(f"✅ Committed changes for {project_name}")
                 
                 # Try to push to GitHub repository
                 try:
                     print(f"Pushing changes to GitHub repository...")
                     # First try normal push
-                    result = subprocess.run(["git", "push", "-u", "origin", "main"], cwd=project_dir, capture_output=True, text=True, timeout=60)
+                    result = subprocess.run(["git", "push", "-u", "origin", "main"], cwd=project_dir, capture_output=True, text=True, timeout=60, env=GIT_ENV)
                     
                     if result.returncode == 0:
                         print(f"✅ Pushed changes to GitHub repository for {project_name}")
                     else:
                         # If push fails due to remote changes, try to handle it
-                        if "rejected" in result.stderr and "fetch first" in result.stderr:
+                        if "rejected" in result.stderr and "fetch first" in result.stderr and self._replace_unrelated_remote_main(project_dir):
+                            print(f"✅ Pushed changes to GitHub repository for {project_name} (replaced the remote's unrelated initial content)")
+                        elif "rejected" in result.stderr and "fetch first" in result.stderr:
                             print("⚠️ Remote repository has initial content, pulling changes first...")
                             
                             # Pull remote changes and merge
                             pull_result = subprocess.run(["git", "pull", "origin", "main", "--allow-unrelated-histories"], 
-                                                       cwd=project_dir, capture_output=True, text=True, timeout=60)
+                                                       cwd=project_dir, capture_output=True, text=True, timeout=60, env=GIT_ENV)
                             
                             if pull_result.returncode == 0:
                                 print("✅ Successfully pulled remote changes")
                                 # Try push again
                                 push_result = subprocess.run(["git", "push", "-u", "origin", "main"], 
-                                                           cwd=project_dir, capture_output=True, text=True, timeout=60)
+                                                           cwd=project_dir, capture_output=True, text=True, timeout=60, env=GIT_ENV)
                                 if push_result.returncode == 0:
                                     print(f"✅ Pushed changes to GitHub repository for {project_name}")
                                 else:
@@ -1680,9 +1796,24 @@ service firebase.storage {
                 print(f"ℹ️ No changes to commit for {project_name}")
                 
         except Exception as e:
-            print(f"Warning: Could not commit Firebase changes: {e}")
+            print(f"Warning: Could not commit and push changes: {e}")
             print("⚠️ Proceeding with remaining steps...")
     
+    def _replace_unrelated_remote_main(self, project_dir: Path) -> bool:
+        """Force-push over a remote main that shares no history with ours (e.g. a fresh repo's
+        initial commit), leased on the fetched commit; False leaves the merge fallback to run"""
+        fetch = subprocess.run(["git", "fetch", "origin", "main"], cwd=project_dir, capture_output=True, text=True, timeout=60, env=GIT_ENV)
+        if fetch.returncode != 0:
+            return False
+        # Related history (e.g. origin is still the template) must be merged, never overwritten
+        if subprocess.run(["git", "merge-base", "HEAD", "FETCH_HEAD"], cwd=project_dir, capture_output=True).returncode != 1:
+            return False
+        remote_head = subprocess.run(["git", "rev-parse", "FETCH_HEAD"], cwd=project_dir, capture_output=True, text=True).stdout.strip()
+        print("⚠️ Remote repository has unrelated initial content, replacing it...")
+        push = subprocess.run(["git", "push", f"--force-with-lease=main:{remote_head}", "-u", "origin", "main"],
+                              cwd=project_dir, capture_output=True, text=True, timeout=60, env=GIT_ENV)
+        return push.returncode == 0
+    
     def create_github_repository(self, project_name: str, description: str, org_domain: str) -> str:
         """Create a new GitHub repository"""
         try:
@@ -1720,10 +1851,10 @@ service firebase.storage {
             
             url = f"https://api.github.com/user/repos"
             
-            response = requests.post(url, headers=headers, json=repo_data, timeout=30)
+            response = self.session.post(url, headers=headers, json=repo_data, timeout=30)
             
             if response.status_code == 201:
-                repo_info = response.json()
+                repo_info = json_loads(response.content)
                 repo_url = repo_info.get('html_url')
                 clone_url = repo_info.get('clone_url')
                 print(f"✅ GitHub repository created successfully: {repo_url}")
@@ -1739,17 +1870,25 @@ service firebase.storage {
     
     def _get_github_username(self, github_token: str) -> str:
         """Get GitHub username from token"""
+        token_key = hashlib.sha256(github_token.encode()).hexdigest()
+        username = self._github_usernames.get(token_key)
+        if username:
+            return username
+        
         try:
             headers = {
                 "Authorization": f"token {github_token}",
                 "Accept": "application/vnd.github.v3+json"
             }
             
-            response = requests.get("https://api.github.com/user", headers=headers, timeout=10)
+            response = self.session.get("https://api.github.com/user", headers=headers, timeout=10)
             
             if response.status_code == 200:
-                user_info = response.json()
-                return user_info.get('login')
+                user_info = json_loads(response.content)
+                username = user_info.get('login')
+                if username:
+                    self._github_usernames[token_key] = username
+                return username
             else:
                 print(f"❌ Failed to get GitHub user info: {response.status_code}")
                 return None
@@ -7,14 +7,16 @@ import json
 import requests
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+@lru_cache(maxsize=1)
 def load_config():
-    """Load configuration from config.json"""
+    """Load configuration from config.json once; every call returns the same shared dict,
+    so callers must not modify it. load_config.cache_clear() rereads the file"""
     config_path = Path("config.json")
     if config_path.exists():
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        return json.loads(config_path.read_text(encoding='utf-8'))
     return {}
 
 def get_github_username(token):